@@ -1,5 +1,6 @@
 """Discovery commands for finding OYD configurations and Azure resources."""
 
+import asyncio
 from typing import Optional
 
 import typer
@@ -179,83 +180,83 @@ def indexes_command(
             console.print(f"Using subscription: [cyan]{subscription_id}[/cyan]\n")
 
         # Discover indexes
-        inventory_service = SearchInventoryService(credential, subscription_id)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Scanning search services...", total=None)
-
-            services = inventory_service.list_search_services(
-                resource_group=resource_group
-            )
-
-            if service_name:
-                services = [s for s in services if s.name == service_name]
-
-            progress.update(task, description="Fetching index details...")
-
-            all_indexes = []
-            for service in services:
-                indexes = inventory_service.get_indexes(service)
-                all_indexes.extend(indexes)
-
-            progress.update(task, completed=True)
-
-        if not all_indexes:
-            console.print(f"{Display.WARNING} No indexes found.")
-            return
-
-        # Display results
-        if output_format == "json":
-            import json
-            console.print(json.dumps([i.model_dump() for i in all_indexes], indent=2, default=str))
-        elif output_format == "yaml":
-            import yaml
-            console.print(yaml.dump([i.model_dump() for i in all_indexes], default_flow_style=False))
-        else:
-            # Table format
-            table = Table(title="Azure AI Search Indexes", box=box.ROUNDED)
-            table.add_column("Service", style="cyan")
-            table.add_column("Index", style="green")
-            table.add_column("Fields", justify="center")
-            table.add_column("Semantic", justify="center")
-            table.add_column("Vector", justify="center")
-            table.add_column("Docs", justify="right")
-
-            for index in all_indexes:
-                semantic = Display.SUCCESS if index.has_semantic_search() else Display.PENDING
-                vector = Display.SUCCESS if index.has_vector_search() else Display.PENDING
-                docs = str(index.document_count) if index.document_count else "-"
-
-                table.add_row(
-                    index.service_name,
-                    index.name,
-                    str(len(index.fields)),
-                    semantic,
-                    vector,
-                    docs,
+        with SearchInventoryService(credential, subscription_id) as inventory_service:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Scanning search services...", total=None)
+
+                services = inventory_service.list_search_services(
+                    resource_group=resource_group
                 )
 
-            console.print(table)
-            console.print(f"\n{Display.SUCCESS} Found {len(all_indexes)} index(es) across {len(services)} service(s).")
+                if service_name:
+                    services = [s for s in services if s.name == service_name]
+
+                progress.update(task, description="Fetching index details...")
+
+                # Document counts are shown in the table, so request them
+                all_indexes = []
+                inventory = inventory_service.inventory_all(services, include_stats=True)
+                for indexes in asyncio.run(inventory):
+                    all_indexes.extend(indexes)
+
+                progress.update(task, completed=True)
+
+            if not all_indexes:
+                console.print(f"{Display.WARNING} No indexes found.")
+                return
+
+            # Display results
+            if output_format == "json":
+                import json
+                console.print(json.dumps([i.model_dump() for i in all_indexes], indent=2, default=str))
+            elif output_format == "yaml":
+                import yaml
+                console.print(yaml.dump([i.model_dump() for i in all_indexes], default_flow_style=False))
+            else:
+                # Table format
+                table = Table(title="Azure AI Search Indexes", box=box.ROUNDED)
+                table.add_column("Service", style="cyan")
+                table.add_column("Index", style="green")
+                table.add_column("Fields", justify="center")
+                table.add_column("Semantic", justify="center")
+                table.add_column("Vector", justify="center")
+                table.add_column("Docs", justify="right")
 
-            # Show analysis if requested
-            if analyze:
-                console.print("\n[bold]Index Analysis:[/bold]\n")
                 for index in all_indexes:
-                    analysis = inventory_service.analyze_index(index)
-                    console.print(f"  [cyan]{index.name}[/cyan]:")
-                    console.print(f"    Recommended query type: [green]{analysis.recommended_query_type}[/green]")
-                    if analysis.recommendations:
-                        for rec in analysis.recommendations:
-                            console.print(f"    {Display.INFO} {rec}")
-                    if analysis.compatibility_issues:
-                        for issue in analysis.compatibility_issues:
-                            console.print(f"    {Display.WARNING} {issue}")
-                    console.print()
+                    semantic = Display.SUCCESS if index.has_semantic_search() else Display.PENDING
+                    vector = Display.SUCCESS if index.has_vector_search() else Display.PENDING
+                    docs = str(index.document_count) if index.document_count else "-"
+
+                    table.add_row(
+                        index.service_name,
+                        index.name,
+                        str(len(index.fields)),
+                        semantic,
+                        vector,
+                        docs,
+                    )
+
+                console.print(table)
+                console.print(f"\n{Display.SUCCESS} Found {len(all_indexes)} index(es) across {len(services)} service(s).")
+
+                # Show analysis if requested
+                if analyze:
+                    console.print("\n[bold]Index Analysis:[/bold]\n")
+                    for index in all_indexes:
+                        analysis = inventory_service.analyze_index(index)
+                        console.print(f"  [cyan]{index.name}[/cyan]:")
+                        console.print(f"    Recommended query type: [green]{analysis.recommended_query_type}[/green]")
+                        if analysis.recommendations:
+                            for rec in analysis.recommendations:
+                                console.print(f"    {Display.INFO} {rec}")
+                        if analysis.compatibility_issues:
+                            for issue in analysis.compatibility_issues:
+                                console.print(f"    {Display.WARNING} {issue}")
+                        console.print()
 
     except Exception as e:
         logger.exception("Discovery failed")
@@ -80,24 +80,23 @@ def agent_command(
         credential = auth_service.get_credential()
 
         # Create test runner
-        test_runner = AgentTestRunner(
+        with AgentTestRunner(
             credential=credential,
             project_endpoint=project_endpoint,
-        )
-
-        # Run tests
-        results = []
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Running {len(test_queries)} test(s)...", total=len(test_queries))
-
-            for test_query in test_queries:
-                result = test_runner.test_agent(agent_name, test_query)
-                results.append(result)
-                progress.advance(task)
+        ) as test_runner:
+            # Run tests
+            results = []
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task(f"Running {len(test_queries)} test(s)...", total=len(test_queries))
+
+                for test_query in test_queries:
+                    result = test_runner.test_agent(agent_name, test_query)
+                    results.append(result)
+                    progress.advance(task)
 
         # Display results
         table = Table(title="Test Results", box=box.ROUNDED)
@@ -150,40 +150,39 @@ def run_discovery_wizard(state: MigrationState, console: Console) -> MigrationSt
     ) as progress:
         task = progress.add_task("Fetching index details...", total=None)
 
-        inventory_service = SearchInventoryService(
+        with SearchInventoryService(
             credential=credential,
             subscription_id=state.azure_config.subscription_id,
-        )
-
-        # Get unique search endpoints and index names from OYD configs
-        # Key: endpoint -> list of index names from that service
-        search_source_map: dict[str, list[str]] = {}
-        for deployment in selected_deployments:
-            if deployment.oyd_config:
-                for source in deployment.oyd_config.get_azure_search_sources():
-                    ep = source.endpoint
-                    if ep not in search_source_map:
-                        search_source_map[ep] = []
-                    if source.index_name and source.index_name not in search_source_map[ep]:
-                        search_source_map[ep].append(source.index_name)
-
-        # Fetch service details and build configs including index names
-        search_configs = []
-        for endpoint, index_names in search_source_map.items():
-            try:
-                service = inventory_service.get_service_by_endpoint(endpoint)
-                if service:
-                    # Use the first index name from OYD config for this service
-                    idx_name = index_names[0] if index_names else None
-                    search_configs.append(SearchConfig(
-                        service_name=service.name,
-                        resource_group=service.resource_group,
-                        endpoint=endpoint,
-                        index_name=idx_name,
-                        use_managed_identity=service.requires_managed_identity,
-                    ))
-            except Exception as e:
-                logger.warning(f"Could not fetch details for {endpoint}: {e}")
+        ) as inventory_service:
+            # Get unique search endpoints and index names from OYD configs
+            # Key: endpoint -> list of index names from that service
+            search_source_map: dict[str, list[str]] = {}
+            for deployment in selected_deployments:
+                if deployment.oyd_config:
+                    for source in deployment.oyd_config.get_azure_search_sources():
+                        ep = source.endpoint
+                        if ep not in search_source_map:
+                            search_source_map[ep] = []
+                        if source.index_name and source.index_name not in search_source_map[ep]:
+                            search_source_map[ep].append(source.index_name)
+
+            # Fetch service details and build configs including index names
+            search_configs = []
+            for endpoint, index_names in search_source_map.items():
+                try:
+                    service = inventory_service.get_service_by_endpoint(endpoint)
+                    if service:
+                        # Use the first index name from OYD config for this service
+                        idx_name = index_names[0] if index_names else None
+                        search_configs.append(SearchConfig(
+                            service_name=service.name,
+                            resource_group=service.resource_group,
+                            endpoint=endpoint,
+                            index_name=idx_name,
+                            use_managed_identity=service.requires_managed_identity,
+                        ))
+                except Exception as e:
+                    logger.warning(f"Could not fetch details for {endpoint}: {e}")
 
         progress.update(task, completed=True)
 
@@ -83,67 +83,66 @@ def run_migration_wizard(state: MigrationState, console: Console) -> MigrationSt
     credential = auth_service.get_credential_from_config(state.azure_config)
 
     # Check for existing projects
-    provisioner = FoundryProvisionerService(
+    with FoundryProvisionerService(
         credential=credential,
         subscription_id=state.azure_config.subscription_id,
-    )
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Checking for existing Foundry projects...", total=None)
-        existing_projects = provisioner.list_projects()
-        progress.update(task, completed=True)
-
-    if existing_projects:
-        console.print(f"\n{Display.INFO} Found {len(existing_projects)} existing Foundry project(s).\n")
-
-        use_existing = questionary.confirm(
-            "Would you like to use an existing project?",
-            default=True,
-        ).ask()
-
-        if use_existing:
-            project_choices = [
-                questionary.Choice(
-                    title=f"{p.name} ({p.resource_group})",
-                    value=p,
-                )
-                for p in existing_projects
-            ]
-
-            selected_project = questionary.select(
-                "Select a project:",
-                choices=project_choices,
+    ) as provisioner:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Checking for existing Foundry projects...", total=None)
+            existing_projects = provisioner.list_projects()
+            progress.update(task, completed=True)
+
+        if existing_projects:
+            console.print(f"\n{Display.INFO} Found {len(existing_projects)} existing Foundry project(s).\n")
+
+            use_existing = questionary.confirm(
+                "Would you like to use an existing project?",
+                default=True,
             ).ask()
 
-            if not selected_project:
-                raise KeyboardInterrupt()
+            if use_existing:
+                project_choices = [
+                    questionary.Choice(
+                        title=f"{p.name} ({p.resource_group})",
+                        value=p,
+                    )
+                    for p in existing_projects
+                ]
+
+                selected_project = questionary.select(
+                    "Select a project:",
+                    choices=project_choices,
+                ).ask()
 
-            # Resolve the real endpoint for the selected project
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Resolving project endpoint...", total=None)
-                resolved_endpoint = provisioner.resolve_project_endpoint(selected_project)
-
-            state.foundry_config = FoundryConfig(
-                project_name=selected_project.name,
-                resource_group=selected_project.resource_group,
-                project_endpoint=resolved_endpoint,
-            )
-            state.migration_options.create_new_project = False
+                if not selected_project:
+                    raise KeyboardInterrupt()
+
+                # Resolve the real endpoint for the selected project
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                ) as progress:
+                    progress.add_task("Resolving project endpoint...", total=None)
+                    resolved_endpoint = provisioner.resolve_project_endpoint(selected_project)
+
+                state.foundry_config = FoundryConfig(
+                    project_name=selected_project.name,
+                    resource_group=selected_project.resource_group,
+                    project_endpoint=resolved_endpoint,
+                )
+                state.migration_options.create_new_project = False
+            else:
+                state.foundry_config = _configure_new_project(console, provisioner)
+                state.migration_options.create_new_project = True
         else:
+            console.print(f"\n{Display.INFO} No existing Foundry projects found.\n")
             state.foundry_config = _configure_new_project(console, provisioner)
             state.migration_options.create_new_project = True
-    else:
-        console.print(f"\n{Display.INFO} No existing Foundry projects found.\n")
-        state.foundry_config = _configure_new_project(console, provisioner)
-        state.migration_options.create_new_project = True
 
     # Select model
     console.print("\n[bold]Select the model for your agents:[/bold]\n")
@@ -75,18 +75,17 @@ def run_review_wizard(state: MigrationState, console: Console) -> MigrationResul
 
             from oyd_migrator.services.foundry_provisioner import FoundryProvisionerService
 
-            provisioner = FoundryProvisionerService(
+            with FoundryProvisionerService(
                 credential=credential,
                 subscription_id=state.azure_config.subscription_id,
-            )
-
-            # Pass hub_resource_id and location if configured
-            project = provisioner.create_project(
-                name=state.foundry_config.project_name,
-                resource_group=state.foundry_config.resource_group,
-                location=getattr(state.foundry_config, 'location', None),
-                hub_resource_id=getattr(state.foundry_config, 'hub_resource_id', None),
-            )
+            ) as provisioner:
+                # Pass hub_resource_id and location if configured
+                project = provisioner.create_project(
+                    name=state.foundry_config.project_name,
+                    resource_group=state.foundry_config.resource_group,
+                    location=getattr(state.foundry_config, 'location', None),
+                    hub_resource_id=getattr(state.foundry_config, 'hub_resource_id', None),
+                )
             state.foundry_config.project_endpoint = project.endpoint
             console.print(f"{Display.SUCCESS} Project created: {project.name}\n")
 
@@ -168,29 +167,28 @@ def run_review_wizard(state: MigrationState, console: Console) -> MigrationResul
         if state.migration_options.test_after_migration:
             console.print(f"{Display.IN_PROGRESS} Running validation tests...\n")
 
-            test_runner = AgentTestRunner(
+            with AgentTestRunner(
                 credential=credential,
                 project_endpoint=state.foundry_config.project_endpoint,
-            )
-
-            test_results = []
-            for agent in agents_created:
-                # Run default test queries
-                test_queries = [
-                    "What information do you have available?",
-                    "Can you provide a brief summary of the main topics?",
-                ]
-
-                # Use agent_id if available (the API needs the ID, not the name)
-                agent_ref = agent.agent_id or agent.name
-
-                for query in test_queries:
-                    test_result = test_runner.test_agent(agent_ref, query)
-                    test_results.append(test_result)
-                    state.test_results[f"{agent.name}:{query[:20]}"] = test_result.success
-
-                    status = Display.SUCCESS if test_result.success else Display.FAILURE
-                    console.print(f"  {status} {agent.name}: {query[:40]}...")
+            ) as test_runner:
+                test_results = []
+                for agent in agents_created:
+                    # Run default test queries
+                    test_queries = [
+                        "What information do you have available?",
+                        "Can you provide a brief summary of the main topics?",
+                    ]
+
+                    # Use agent_id if available (the API needs the ID, not the name)
+                    agent_ref = agent.agent_id or agent.name
+
+                    for query in test_queries:
+                        test_result = test_runner.test_agent(agent_ref, query)
+                        test_results.append(test_result)
+                        state.test_results[f"{agent.name}:{query[:20]}"] = test_result.success
+
+                        status = Display.SUCCESS if test_result.success else Display.FAILURE
+                        console.print(f"  {status} {agent.name}: {query[:40]}...")
 
             result.test_results = test_results
             console.print()
@@ -19,9 +19,15 @@ class ApiVersions:
     FOUNDRY_AGENTS = "v1"  # Agent Service (uses v1 not date-based versions)
     FOUNDRY_PROJECTS = "2025-01-01-preview"  # Project management
     FOUNDRY_CONNECTIONS = "2024-07-01-preview"  # Connections API
+    RESPONSES_PREVIEW = "2025-11-15-preview"  # Conversations and Responses (agent invocation)
+
+    # Azure Machine Learning / CognitiveServices (Foundry hubs, accounts, projects)
+    ML_WORKSPACES = "2024-04-01"  # ML workspaces (hubs and projects)
+    COGNITIVE_SERVICES_ACCOUNTS = "2024-10-01"  # Accounts and account projects
 
     # Azure Resource Manager
     ARM = "2023-07-01"
+    RESOURCE_GRAPH = "2021-03-01"  # Resource Graph queries
 
 
 # Azure Scopes for authentication
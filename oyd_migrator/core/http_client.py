@@ -0,0 +1,249 @@
+"""Shared HTTP client construction with retry handling for Azure REST calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import httpx
+
+from oyd_migrator.core.logging import get_logger
+
+logger = get_logger("core.http_client")
+
+# Status codes ARM and the Search data plane return for throttling or
+# transient backend failures
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Methods that are safe to resend after the server may already have seen them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+MAX_RETRIES = 3
+BACKOFF_INITIAL_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+RETRY_AFTER_MAX_SECONDS = 60.0
+# Request extension holding a time.monotonic() deadline for the whole call,
+# retries included; pass it via extensions={DEADLINE_EXTENSION: ...}
+DEADLINE_EXTENSION = "retry_deadline"
+
+
+def retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """
+    Compute how long to wait before retrying a request.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        response: Response that triggered the retry, if any
+
+    Returns:
+        Delay in seconds. A numeric Retry-After header wins; otherwise
+        exponential backoff with full jitter.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX_SECONDS)
+            except ValueError:
+                pass
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_INITIAL_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+def should_retry_error(request: httpx.Request, error: httpx.TransportError) -> bool:
+    """
+    Decide whether a transport failure can be retried.
+
+    Args:
+        request: Request that failed
+        error: Transport error raised while sending it
+
+    Returns:
+        True for connection failures, where the request never reached the
+        server; read/write failures only for idempotent methods.
+    """
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    return request.method in IDEMPOTENT_METHODS
+
+
+def should_retry_status(request: httpx.Request, status_code: int) -> bool:
+    """
+    Decide whether a response status can be retried.
+
+    Args:
+        request: Request that produced the response
+        status_code: Response status code
+
+    Returns:
+        True for 429, which the server rejected without processing; other
+        retry statuses only for idempotent methods.
+    """
+    if status_code not in RETRY_STATUS_CODES:
+        return False
+    return status_code == 429 or request.method in IDEMPOTENT_METHODS
+
+
+def _apply_deadline(request: httpx.Request) -> None:
+    """Clamp each timeout phase of the next attempt to the request's deadline."""
+    deadline = request.extensions.get(DEADLINE_EXTENSION)
+    if deadline is None:
+        return
+    time_left = max(deadline - time.monotonic(), 0.0)
+    request.extensions["timeout"] = {
+        phase: time_left if limit is None else min(limit, time_left)
+        for phase, limit in request.extensions.get("timeout", {}).items()
+    }
+
+
+def _within_deadline(request: httpx.Request, delay: float) -> bool:
+    """Check whether waiting ``delay`` seconds still leaves time for a retry."""
+    deadline = request.extensions.get(DEADLINE_EXTENSION)
+    return deadline is None or time.monotonic() + delay < deadline
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    Transport that retries throttled and transient failures.
+
+    Non-idempotent requests (POST, PATCH) are only resent when the server
+    cannot have acted on them: connection failures and 429 responses. A
+    request carrying a DEADLINE_EXTENSION is not retried past that deadline.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        max_retries: int = MAX_RETRIES,
+    ):
+        self._transport = transport
+        self._max_retries = max_retries
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self._max_retries + 1):
+            last_attempt = attempt == self._max_retries
+            _apply_deadline(request)
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as e:
+                delay = retry_delay(attempt)
+                if (
+                    last_attempt
+                    or not should_retry_error(request, e)
+                    or not _within_deadline(request, delay)
+                ):
+                    raise
+                logger.debug(f"{request.method} {request.url} failed ({e!r}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if last_attempt or not should_retry_status(request, response.status_code):
+                return response
+
+            delay = retry_delay(attempt, response)
+            if not _within_deadline(request, delay):
+                return response
+            logger.debug(f"{request.method} {request.url} returned {response.status_code}, retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`RetryTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int = MAX_RETRIES,
+    ):
+        self._transport = transport
+        self._max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self._max_retries + 1):
+            last_attempt = attempt == self._max_retries
+            _apply_deadline(request)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                delay = retry_delay(attempt)
+                if (
+                    last_attempt
+                    or not should_retry_error(request, e)
+                    or not _within_deadline(request, delay)
+                ):
+                    raise
+                logger.debug(f"{request.method} {request.url} failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if last_attempt or not should_retry_status(request, response.status_code):
+                return response
+
+            delay = retry_delay(attempt, response)
+            if not _within_deadline(request, delay):
+                return response
+            logger.debug(f"{request.method} {request.url} returned {response.status_code}, retrying in {delay:.1f}s")
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_http_client(
+    timeout: float | httpx.Timeout = 30,
+    limits: httpx.Limits | None = None,
+    max_retries: int = MAX_RETRIES,
+    **kwargs,
+) -> httpx.Client:
+    """
+    Create a pooled HTTP/2 client whose requests retry on throttling.
+
+    Args:
+        timeout: Request timeout
+        limits: Connection pool limits
+        max_retries: Retries after the first attempt
+        **kwargs: Extra arguments forwarded to httpx.Client
+
+    Returns:
+        Configured httpx.Client
+    """
+    transport = httpx.HTTPTransport(http2=True, limits=limits or httpx.Limits())
+    return httpx.Client(
+        transport=RetryTransport(transport, max_retries=max_retries),
+        timeout=timeout,
+        **kwargs,
+    )
+
+
+def create_async_http_client(
+    timeout: float | httpx.Timeout = 30,
+    limits: httpx.Limits | None = None,
+    max_retries: int = MAX_RETRIES,
+    **kwargs,
+) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP/2 client whose requests retry on throttling.
+
+    Args:
+        timeout: Request timeout
+        limits: Connection pool limits
+        max_retries: Retries after the first attempt
+        **kwargs: Extra arguments forwarded to httpx.AsyncClient
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits or httpx.Limits())
+    return httpx.AsyncClient(
+        transport=AsyncRetryTransport(transport, max_retries=max_retries),
+        timeout=timeout,
+        **kwargs,
+    )
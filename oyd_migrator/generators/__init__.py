@@ -2,10 +2,11 @@
 
 from oyd_migrator.generators.sdk_samples import generate_python_sample
 from oyd_migrator.generators.curl_samples import generate_curl_commands
-from oyd_migrator.generators.migration_report import generate_report
+from oyd_migrator.generators.migration_report import generate_report, generate_report_context
 
 __all__ = [
     "generate_python_sample",
     "generate_curl_commands",
     "generate_report",
+    "generate_report_context",
 ]
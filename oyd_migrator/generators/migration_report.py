@@ -32,6 +32,32 @@ def generate_report(
         return _generate_markdown_report(state)
 
 
+def generate_report_context(state: MigrationState) -> dict:
+    """
+    Collect the test counts and statuses every report format renders.
+
+    Args:
+        state: Migration session state
+
+    Returns:
+        Dict with session_id, tests_passed, tests_total and per-test results
+    """
+    results = [
+        {
+            "name": test_name,
+            "passed": passed,
+            "status": "✅ Passed" if passed else "❌ Failed",
+        }
+        for test_name, passed in state.test_results.items()
+    ]
+    return {
+        "session_id": state.session_id,
+        "tests_passed": sum(1 for r in results if r["passed"]),
+        "tests_total": len(results),
+        "results": results,
+    }
+
+
 def _generate_markdown_report(state: MigrationState) -> str:
     """Generate Markdown format report."""
     path_name = (
@@ -40,9 +66,7 @@ def _generate_markdown_report(state: MigrationState) -> str:
         else "Foundry IQ Knowledge Base"
     )
 
-    # Count test results
-    tests_passed = sum(1 for v in state.test_results.values() if v)
-    tests_total = len(state.test_results)
+    context = generate_report_context(state)
 
     report = f"""# OYD to Foundry Migration Report
 
@@ -61,7 +85,7 @@ def _generate_markdown_report(state: MigrationState) -> str:
 | Search Services | {len(state.search_configs)} |
 | Connections Created | {len(state.created_connections)} |
 | Agents Created | {len(state.created_agents)} |
-| Tests Passed | {tests_passed}/{tests_total} |
+| Tests Passed | {context["tests_passed"]}/{context["tests_total"]} |
 
 ---
 
@@ -136,9 +160,8 @@ def _generate_markdown_report(state: MigrationState) -> str:
 | Test | Status |
 |------|--------|
 """
-        for test_name, passed in state.test_results.items():
-            status = "✅ Passed" if passed else "❌ Failed"
-            report += f"| {test_name} | {status} |\n"
+        for result in context["results"]:
+            report += f"| {result['name']} | {result['status']} |\n"
 
     report += f"""
 ---
@@ -217,7 +240,13 @@ def _generate_html_report(state: MigrationState) -> str:
 
 def _generate_json_report(state: MigrationState) -> str:
     """Generate JSON format report."""
-    report_data = {
+    return json.dumps(_build_report_dict(state), indent=2, default=str)
+
+
+def _build_report_dict(state: MigrationState) -> dict:
+    """Build the report structure serialized by the JSON format."""
+    context = generate_report_context(state)
+    return {
         "metadata": {
             "session_id": state.session_id,
             "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -231,8 +260,8 @@ def _generate_json_report(state: MigrationState) -> str:
             "search_services": len(state.search_configs),
             "connections_created": len(state.created_connections),
             "agents_created": len(state.created_agents),
-            "tests_passed": sum(1 for v in state.test_results.values() if v),
-            "tests_total": len(state.test_results),
+            "tests_passed": context["tests_passed"],
+            "tests_total": context["tests_total"],
         },
         "source": {
             "aoai_deployments": [
@@ -273,5 +302,3 @@ def _generate_json_report(state: MigrationState) -> str:
         },
         "test_results": state.test_results,
     }
-
-    return json.dumps(report_data, indent=2, default=str)
@@ -4,12 +4,19 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+# Models mirroring Search REST payloads accept the camelCase API names, so
+# they can be validated straight from a response; snake_case still works.
+API_MODEL_CONFIG = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
 
 class IndexField(BaseModel):
     """A field in a search index."""
 
+    model_config = API_MODEL_CONFIG
+
     name: str = Field(description="Field name")
     type: str = Field(description="Field type (Edm.String, Collection(Edm.Single), etc.)")
 
@@ -50,12 +57,16 @@ class IndexField(BaseModel):
 class SemanticField(BaseModel):
     """A field reference in a semantic configuration."""
 
+    model_config = API_MODEL_CONFIG
+
     field_name: str = Field(description="Name of the referenced field")
 
 
 class SemanticPrioritizedFields(BaseModel):
     """Prioritized fields for semantic search."""
 
+    model_config = API_MODEL_CONFIG
+
     title_field: SemanticField | None = Field(default=None)
     content_fields: list[SemanticField] = Field(default_factory=list)
     keyword_fields: list[SemanticField] = Field(default_factory=list)
@@ -64,6 +75,8 @@ class SemanticPrioritizedFields(BaseModel):
 class SemanticConfig(BaseModel):
     """A semantic search configuration."""
 
+    model_config = API_MODEL_CONFIG
+
     name: str = Field(description="Semantic configuration name")
     prioritized_fields: SemanticPrioritizedFields = Field(
         default_factory=SemanticPrioritizedFields
@@ -84,10 +97,19 @@ class VectorSearchAlgorithm(BaseModel):
 class VectorSearchProfile(BaseModel):
     """A vector search profile."""
 
+    model_config = API_MODEL_CONFIG
+
     name: str = Field(description="Profile name")
-    algorithm_configuration_name: str = Field(description="Algorithm to use")
+    # GA and current preview payloads use "algorithm"/"vectorizer"; older
+    # previews used the longer names
+    algorithm_configuration_name: str = Field(
+        default="",
+        validation_alias=AliasChoices("algorithm", "algorithmConfigurationName"),
+        description="Algorithm to use",
+    )
     vectorizer_name: str | None = Field(
         default=None,
+        validation_alias=AliasChoices("vectorizer", "vectorizerName"),
         description="Vectorizer for query-time embedding",
     )
 
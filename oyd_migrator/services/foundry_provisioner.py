@@ -2,15 +2,51 @@
 
 from __future__ import annotations
 
+import re
+import threading
+import time
+
+import httpx
+import orjson
 from azure.core.credentials import TokenCredential
 
-from oyd_migrator.core.constants import ApiVersions
+from oyd_migrator.core.config import get_settings
+from oyd_migrator.core.constants import ApiVersions, AzureScopes
 from oyd_migrator.core.exceptions import ProvisioningError
+from oyd_migrator.core.http_client import create_http_client
 from oyd_migrator.core.logging import get_logger
 from oyd_migrator.models.foundry import FoundryProject, FoundryResource
 
 logger = get_logger("services.foundry_provisioner")
 
+ARM_ENDPOINT = "https://management.azure.com"
+
+# Resource Graph is tenant-level, outside the subscription-scoped base URL
+RESOURCE_GRAPH_URL = f"{ARM_ENDPOINT}/providers/Microsoft.ResourceGraph/resources"
+
+# Projects and accounts are usually listed back-to-back by the wizard,
+# so a single Resource Graph result is reused for a short window.
+FOUNDRY_CACHE_TTL_SECONDS = 30
+
+# Extracts the resource group name from an ARM resource ID
+_RESOURCE_GROUP_RE = re.compile(r"/resourceGroups/([^/]+)", re.IGNORECASE)
+
+# Cached tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# CognitiveServices account kinds that can host Foundry projects
+FOUNDRY_ACCOUNT_KINDS = frozenset({"AIServices"})
+
+# Filtering and column projection happen server-side, so only Foundry
+# resources (and only the columns we read) are returned
+FOUNDRY_RESOURCES_QUERY = (
+    "resources"
+    " | where (type =~ 'microsoft.machinelearningservices/workspaces'"
+    " and kind in~ ('Project', 'Hub'))"
+    " or type =~ 'microsoft.cognitiveservices/accounts/projects'"
+    " | project id, name, type, kind, location, properties"
+)
+
 
 class FoundryProvisionerService:
     """Service for provisioning Azure AI Foundry resources."""
@@ -26,6 +62,46 @@ class FoundryProvisionerService:
         self.credential = credential
         self.subscription_id = subscription_id
 
+        # One pooled client so every ARM call reuses the same TLS connection;
+        # requests pass subscription-relative paths and their api-version
+        self._http = create_http_client(
+            base_url=f"{ARM_ENDPOINT}/subscriptions/{subscription_id}",
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+        self._token_cache: dict[str, tuple[str, float]] = {}
+        self._token_lock = threading.Lock()
+        self._foundry_cache: tuple[float, list[FoundryProject], list[FoundryProject]] | None = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> FoundryProvisionerService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_token(self, scope: str) -> str:
+        """
+        Get a bearer token for a scope, reusing it until shortly before expiry.
+
+        Args:
+            scope: OAuth scope to request
+
+        Returns:
+            Access token string
+        """
+        with self._token_lock:
+            cached = self._token_cache.get(scope)
+            if cached and cached[1] - time.time() > TOKEN_REFRESH_MARGIN_SECONDS:
+                return cached[0]
+
+            access_token = self.credential.get_token(scope)
+            self._token_cache[scope] = (access_token.token, access_token.expires_on)
+            return access_token.token
+
     def list_projects(self) -> list[FoundryProject]:
         """
         List existing Foundry projects from both architectures:
@@ -35,11 +111,7 @@ class FoundryProvisionerService:
         Returns:
             List of Foundry projects
         """
-        projects = []
-        
-        # Get projects from both sources
-        projects.extend(self._list_ml_workspace_projects())
-        projects.extend(self._list_cognitive_services_projects())
+        projects, _ = self._query_all_foundry()
         
         # Deduplicate by name (prefer CognitiveServices version if both exist)
         seen_names = set()
@@ -51,51 +123,188 @@ class FoundryProvisionerService:
         
         logger.debug(f"Found {len(unique_projects)} Foundry project(s) total")
         return unique_projects
-    
-    def _list_ml_workspace_projects(self) -> list[FoundryProject]:
-        """List projects from ML Workspaces (older architecture)."""
-        import httpx
-        from oyd_migrator.core.constants import AzureScopes
 
-        projects = []
+    def _query_all_foundry(self) -> tuple[list[FoundryProject], list[FoundryProject]]:
+        """
+        Query all Foundry projects and accounts with a single Resource Graph call.
+
+        Falls back to the per-provider ARM listings if Resource Graph is unavailable.
+        Results are cached for FOUNDRY_CACHE_TTL_SECONDS.
+
+        Returns:
+            Tuple of (projects, accounts)
+        """
+        now = time.monotonic()
+        if self._foundry_cache and now - self._foundry_cache[0] < FOUNDRY_CACHE_TTL_SECONDS:
+            _, projects, accounts = self._foundry_cache
+            return list(projects), list(accounts)
 
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
+            rows = self._query_resource_graph(FOUNDRY_RESOURCES_QUERY)
+
+            ml_projects = []
+            cs_projects = []
+            accounts = []
+            for row in rows:
+                resource_type = row.get("type", "").lower()
+                kind = (row.get("kind") or "").lower()
+
+                if resource_type == "microsoft.cognitiveservices/accounts/projects":
+                    cs_projects.append(self._cognitive_services_row_to_project(row))
+                elif kind == "project":
+                    ml_projects.append(self._ml_workspace_to_project(row))
+                elif kind == "hub":
+                    accounts.append(self._ml_workspace_to_account(row))
+
+            # ML Workspace projects first to keep the previous listing order
+            projects = ml_projects + cs_projects
+
+        except Exception as e:
+            logger.warning(f"Resource Graph query failed, falling back to ARM listing: {e}")
+            projects = self._list_ml_workspace_projects() + self._list_cognitive_services_projects()
+            accounts = self._list_ml_workspace_accounts()
+
+        logger.debug(f"Found {len(projects)} Foundry project(s) and {len(accounts)} account(s)")
+        self._foundry_cache = (now, projects, accounts)
+        return list(projects), list(accounts)
+
+    def _query_resource_graph(self, query: str) -> list[dict]:
+        """
+        Run a Resource Graph query scoped to this subscription.
+
+        Args:
+            query: Kusto query to run
 
-            url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
-                f"/providers/Microsoft.MachineLearningServices/workspaces"
-                f"?api-version=2024-04-01"
+        Returns:
+            All result rows, following $skipToken pagination
+        """
+        token = self._get_token(AzureScopes.MANAGEMENT)
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+        body: dict = {"subscriptions": [self.subscription_id], "query": query}
+        rows: list[dict] = []
+
+        while True:
+            response = self._http.post(
+                RESOURCE_GRAPH_URL,
+                params={"api-version": ApiVersions.RESOURCE_GRAPH},
+                headers=headers,
+                json=body,
+                timeout=30,
             )
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+            rows.extend(data.get("data", []))
+
+            skip_token = data.get("$skipToken")
+            if not skip_token:
+                break
+            body["options"] = {"$skipToken": skip_token}
+
+        return rows
+
+    def _row_to_project(
+        self,
+        name: str,
+        resource_name: str,
+        resource_group: str,
+        location: str,
+        endpoint: str,
+        has_agent_service: bool = True,
+    ) -> FoundryProject:
+        """
+        Build a FoundryProject from values read off an ARM response.
+
+        ARM already guarantees the field types, so model_construct is used
+        to skip pydantic validation when listing large subscriptions.
+        """
+        return FoundryProject.model_construct(
+            name=name,
+            resource_name=resource_name,
+            resource_group=resource_group,
+            subscription_id=self.subscription_id,
+            location=location or "",
+            endpoint=endpoint,
+            has_agent_service=has_agent_service,
+        )
+
+    def _ml_workspace_to_project(self, workspace: dict) -> FoundryProject:
+        """Build a project from an ML Workspace of kind "Project"."""
+        rg = _RESOURCE_GROUP_RE.search(workspace["id"]).group(1)
+        props = workspace.get("properties") or {}
+        placeholder_endpoint = self._build_project_endpoint(workspace, props)
+
+        return self._row_to_project(
+            name=workspace["name"],
+            resource_name=props.get("hubResourceId", "").split("/")[-1] if props.get("hubResourceId") else workspace["name"],
+            resource_group=rg,
+            location=workspace.get("location", ""),
+            endpoint=placeholder_endpoint,
+        )
+
+    def _ml_workspace_to_account(self, workspace: dict) -> FoundryProject:
+        """Build an account from an ML Workspace of kind "Hub"."""
+        rg = _RESOURCE_GROUP_RE.search(workspace["id"]).group(1)
+
+        return self._row_to_project(
+            name=workspace["name"],
+            resource_name=workspace["name"],
+            resource_group=rg,
+            location=workspace.get("location", ""),
+            endpoint="",  # Accounts don't have direct endpoints
+            has_agent_service=False,
+        )
+
+    def _cognitive_services_row_to_project(self, row: dict) -> FoundryProject:
+        """
+        Build a project from a Resource Graph row for a CognitiveServices project.
+
+        The resource ID has the form
+        .../providers/Microsoft.CognitiveServices/accounts/{account}/projects/{project}
+        """
+        parts = row["id"].split("/")
+        account_name = parts[-3]
+        proj_name = parts[-1]
+        rg = _RESOURCE_GROUP_RE.search(row["id"]).group(1)
+
+        return self._row_to_project(
+            name=proj_name,
+            resource_name=account_name,
+            resource_group=rg,
+            location=row.get("location", ""),
+            endpoint=f"https://{account_name}.services.ai.azure.com/api/projects/{proj_name}",
+        )
+
+    def _list_ml_workspace_projects(self) -> list[FoundryProject]:
+        """List projects from ML Workspaces (older architecture)."""
+        projects = []
+
+        try:
+            token = self._get_token(AzureScopes.MANAGEMENT)
 
             headers = {
-                "Authorization": f"Bearer {token.token}",
+                "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             }
 
-            response = httpx.get(url, headers=headers, timeout=30)
+            response = self._http.get(
+                "/providers/Microsoft.MachineLearningServices/workspaces",
+                params={"api-version": ApiVersions.ML_WORKSPACES},
+                headers=headers,
+                timeout=30,
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for workspace in data.get("value", []):
-                kind = workspace.get("kind", "")
-
-                if kind == "Project":
-                    rg = workspace["id"].split("/resourceGroups/")[1].split("/")[0]
-                    props = workspace.get("properties", {})
-                    placeholder_endpoint = self._build_project_endpoint(workspace, props)
-
-                    project = FoundryProject(
-                        name=workspace["name"],
-                        resource_name=props.get("hubResourceId", "").split("/")[-1] if props.get("hubResourceId") else workspace["name"],
-                        resource_group=rg,
-                        subscription_id=self.subscription_id,
-                        location=workspace.get("location", ""),
-                        endpoint=placeholder_endpoint,
-                        has_agent_service=True,
-                    )
-                    projects.append(project)
+                if workspace.get("kind", "") == "Project":
+                    projects.append(self._ml_workspace_to_project(workspace))
 
             logger.debug(f"Found {len(projects)} ML Workspace project(s)")
 
@@ -111,65 +320,35 @@ class FoundryProvisionerService:
         These are projects created via the new Foundry portal that live under
         Microsoft.CognitiveServices/accounts/{account}/projects/{project}
         """
-        import httpx
-        from oyd_migrator.core.constants import AzureScopes
-
         projects = []
 
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
+            token = self._get_token(AzureScopes.MANAGEMENT)
             headers = {
-                "Authorization": f"Bearer {token.token}",
+                "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             }
 
             # First, list all CognitiveServices accounts
-            accounts_url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
-                f"/providers/Microsoft.CognitiveServices/accounts"
-                f"?api-version=2024-10-01"
+            response = self._http.get(
+                "/providers/Microsoft.CognitiveServices/accounts",
+                params={"api-version": ApiVersions.COGNITIVE_SERVICES_ACCOUNTS},
+                headers=headers,
+                timeout=30,
             )
-
-            response = httpx.get(accounts_url, headers=headers, timeout=30)
             response.raise_for_status()
-            accounts_data = response.json()
+            accounts_data = orjson.loads(response.content)
 
             for account in accounts_data.get("value", []):
+                # Only AIServices accounts can host Foundry projects, so skip
+                # plain OpenAI/Speech/etc. accounts without probing them
+                if account.get("kind") not in FOUNDRY_ACCOUNT_KINDS:
+                    continue
+
                 account_name = account["name"]
-                account_id = account["id"]
-                rg = account_id.split("/resourceGroups/")[1].split("/")[0]
-                location = account.get("location", "")
-                
-                # Check if this account has projects (it's a Foundry Account)
-                # by looking for the projects sub-resource
-                projects_url = (
-                    f"https://management.azure.com{account_id}/projects"
-                    f"?api-version=2024-10-01"
-                )
 
                 try:
-                    proj_response = httpx.get(projects_url, headers=headers, timeout=30)
-                    if proj_response.status_code == 200:
-                        proj_data = proj_response.json()
-                        
-                        for proj in proj_data.get("value", []):
-                            proj_name = proj["name"]
-                            
-                            # Build the endpoint for CognitiveServices-based projects
-                            # Format: https://{account}.services.ai.azure.com/api/projects/{project}
-                            endpoint = f"https://{account_name}.services.ai.azure.com/api/projects/{proj_name}"
-                            
-                            project = FoundryProject(
-                                name=proj_name,
-                                resource_name=account_name,
-                                resource_group=rg,
-                                subscription_id=self.subscription_id,
-                                location=location,
-                                endpoint=endpoint,
-                                has_agent_service=True,
-                            )
-                            projects.append(project)
-                            
+                    projects.extend(self._list_account_projects(account, headers))
                 except Exception as e:
                     # Account doesn't have projects or we can't access them
                     logger.debug(f"Could not list projects for account {account_name}: {e}")
@@ -182,6 +361,73 @@ class FoundryProvisionerService:
 
         return projects
 
+    def _list_account_projects(self, account: dict, headers: dict) -> list[FoundryProject]:
+        """
+        List the projects under a single CognitiveServices account.
+
+        A $top=1 probe is sent first so accounts without projects cost a
+        near-empty response; the full list is only paged through when the
+        probe shows more than one project.
+
+        Args:
+            account: Account entry from the ARM accounts listing
+            headers: Request headers including the bearer token
+
+        Returns:
+            Projects under the account
+        """
+        account_name = account["name"]
+        rg = _RESOURCE_GROUP_RE.search(account["id"]).group(1)
+        location = account.get("location", "")
+
+        projects_path = (
+            f"/resourceGroups/{rg}/providers/Microsoft.CognitiveServices"
+            f"/accounts/{account_name}/projects"
+        )
+        params = {"api-version": ApiVersions.COGNITIVE_SERVICES_ACCOUNTS}
+
+        probe = self._http.get(
+            projects_path, params={**params, "$top": 1}, headers=headers, timeout=30
+        )
+        if probe.status_code != 200:
+            return []
+
+        page = probe.json()
+        if not page.get("value"):
+            return []
+
+        items = list(page["value"])
+        if page.get("nextLink"):
+            # More than one project: fetch the full list
+            # (nextLink is absolute and already carries its own query)
+            items = []
+            response = self._http.get(projects_path, params=params, headers=headers, timeout=30)
+            while True:
+                response.raise_for_status()
+                page = orjson.loads(response.content)
+                items.extend(page.get("value", []))
+                if not page.get("nextLink"):
+                    break
+                response = self._http.get(page["nextLink"], headers=headers, timeout=30)
+
+        projects = []
+        for proj in items:
+            proj_name = proj["name"]
+
+            # Build the endpoint for CognitiveServices-based projects
+            # Format: https://{account}.services.ai.azure.com/api/projects/{project}
+            endpoint = f"https://{account_name}.services.ai.azure.com/api/projects/{proj_name}"
+
+            projects.append(self._row_to_project(
+                name=proj_name,
+                resource_name=account_name,
+                resource_group=rg,
+                location=location,
+                endpoint=endpoint,
+            ))
+
+        return projects
+
     def resolve_project_endpoint(self, project: 'FoundryProject') -> str:
         """
         Resolve the real AI Services endpoint for a selected project.
@@ -195,11 +441,9 @@ class FoundryProvisionerService:
         Returns:
             The resolved endpoint (may be same as input if resolution fails)
         """
-        from oyd_migrator.core.constants import AzureScopes
-        
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
-            real_endpoint = self._get_ai_services_endpoint(project, token.token)
+            token = self._get_token(AzureScopes.MANAGEMENT)
+            real_endpoint = self._get_ai_services_endpoint(project, token)
             if real_endpoint:
                 return real_endpoint
         except Exception as e:
@@ -217,47 +461,38 @@ class FoundryProvisionerService:
         Returns:
             List of Foundry accounts (using FoundryProject model for simplicity)
         """
-        import httpx
-        from oyd_migrator.core.constants import AzureScopes
+        _, accounts = self._query_all_foundry()
+        return accounts
+
+    # Alias for backward compatibility
+    list_hubs = list_foundry_accounts
 
+    def _list_ml_workspace_accounts(self) -> list[FoundryProject]:
+        """List Foundry Accounts from ML Workspaces of kind "Hub"."""
         accounts = []
 
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
-
-            url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
-                f"/providers/Microsoft.MachineLearningServices/workspaces"
-                f"?api-version=2024-04-01"
-            )
+            token = self._get_token(AzureScopes.MANAGEMENT)
 
             headers = {
-                "Authorization": f"Bearer {token.token}",
+                "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             }
 
-            response = httpx.get(url, headers=headers, timeout=30)
+            response = self._http.get(
+                "/providers/Microsoft.MachineLearningServices/workspaces",
+                params={"api-version": ApiVersions.ML_WORKSPACES},
+                headers=headers,
+                timeout=30,
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for workspace in data.get("value", []):
-                kind = workspace.get("kind", "")
-
                 # "Hub" kind represents Foundry Accounts in the API
-                if kind == "Hub":
-                    rg = workspace["id"].split("/resourceGroups/")[1].split("/")[0]
-
-                    account = FoundryProject(
-                        name=workspace["name"],
-                        resource_name=workspace["name"],
-                        resource_group=rg,
-                        subscription_id=self.subscription_id,
-                        location=workspace.get("location", ""),
-                        endpoint="",  # Accounts don't have direct endpoints
-                        has_agent_service=False,
-                    )
-                    accounts.append(account)
+                if workspace.get("kind", "") == "Hub":
+                    accounts.append(self._ml_workspace_to_account(workspace))
 
             logger.debug(f"Found {len(accounts)} Foundry account(s)")
 
@@ -265,9 +500,6 @@ class FoundryProvisionerService:
             logger.warning(f"Could not list Foundry accounts: {e}")
 
         return accounts
-    
-    # Alias for backward compatibility
-    list_hubs = list_foundry_accounts
 
     def _build_project_endpoint(self, workspace: dict, properties: dict) -> str:
         """
@@ -306,6 +538,57 @@ class FoundryProvisionerService:
         # Fallback: use the workspace name as the Foundry Account name
         return f"https://{workspace_name}.services.ai.azure.com/api/projects/{workspace_name}"
     
+    def _list_connections(self, project: FoundryProject, token: str) -> httpx.Response:
+        """List a workspace project's connections through the ARM client."""
+        return self._http.get(
+            f"/resourceGroups/{project.resource_group}"
+            f"/providers/Microsoft.MachineLearningServices/workspaces/{project.name}"
+            f"/connections",
+            params={"api-version": ApiVersions.FOUNDRY_CONNECTIONS},
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            timeout=30,
+        )
+
+    def _select_ai_services_target(self, project: FoundryProject, data: dict) -> str | None:
+        """
+        Pick the AI Services endpoint out of a connections listing.
+
+        Args:
+            project: Project the connections belong to (used for logging)
+            data: Connections list response
+
+        Returns:
+            AIServices target (preferred), converted AzureOpenAI target, or None
+        """
+        # Single pass: return the AIServices connection as soon as it is seen,
+        # remembering the first AzureOpenAI connection as a fallback
+        openai_fallback = None
+        for conn in data.get("value", []):
+            props = conn.get("properties", {})
+            category = props.get("category", "")
+            target = props.get("target", "")
+            if not target:
+                continue
+
+            if category == "AIServices":
+                logger.debug(f"Found AIServices endpoint for {project.name}: {target}")
+                return target
+
+            if category == "AzureOpenAI" and openai_fallback is None:
+                openai_fallback = target
+
+        if openai_fallback:
+            # Convert OpenAI endpoint format to cognitiveservices format
+            # e.g., https://x.openai.azure.com/ -> https://x.cognitiveservices.azure.com/
+            target = openai_fallback.replace(".openai.azure.com", ".cognitiveservices.azure.com")
+            logger.debug(f"Using AzureOpenAI endpoint for {project.name}: {target}")
+            return target
+
+        return None
+
     def _get_ai_services_endpoint(self, project: 'FoundryProject', token: str) -> str | None:
         """
         Get the AI Services endpoint from project connections during listing.
@@ -317,56 +600,13 @@ class FoundryProvisionerService:
         Returns:
             AI Services endpoint URL, or None if not found
         """
-        import httpx
-        
         try:
-            # List connections for the workspace
-            url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
-                f"/resourceGroups/{project.resource_group}"
-                f"/providers/Microsoft.MachineLearningServices/workspaces/{project.name}"
-                f"/connections?api-version=2024-07-01-preview"
-            )
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-            
-            response = httpx.get(url, headers=headers, timeout=30)
+            response = self._list_connections(project, token)
             if response.status_code != 200:
                 return None
-            
-            data = response.json()
-            
-            # Find the AIServices connection (preferred) or AzureOpenAI connection
-            for conn in data.get("value", []):
-                props = conn.get("properties", {})
-                category = props.get("category", "")
-                
-                if category == "AIServices":
-                    target = props.get("target", "")
-                    if target:
-                        logger.debug(f"Found AIServices endpoint for {project.name}: {target}")
-                        return target
-            
-            # Fallback: try AzureOpenAI connection
-            for conn in data.get("value", []):
-                props = conn.get("properties", {})
-                category = props.get("category", "")
-                
-                if category == "AzureOpenAI":
-                    target = props.get("target", "")
-                    if target:
-                        # Convert OpenAI endpoint format to cognitiveservices format
-                        # e.g., https://x.openai.azure.com/ -> https://x.cognitiveservices.azure.com/
-                        if ".openai.azure.com" in target:
-                            target = target.replace(".openai.azure.com", ".cognitiveservices.azure.com")
-                        logger.debug(f"Using AzureOpenAI endpoint for {project.name}: {target}")
-                        return target
-            
-            return None
-            
+
+            return self._select_ai_services_target(project, response.json())
+
         except Exception as e:
             logger.debug(f"Could not get AI Services endpoint for {project.name}: {e}")
             return None
@@ -383,26 +623,11 @@ class FoundryProvisionerService:
         Returns:
             The AI Services endpoint URL, or None if not found
         """
-        import httpx
-        from oyd_migrator.core.constants import AzureScopes
-        
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
+            token = self._get_token(AzureScopes.MANAGEMENT)
             
             # List connections for the workspace
-            url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
-                f"/resourceGroups/{project.resource_group}"
-                f"/providers/Microsoft.MachineLearningServices/workspaces/{project.name}"
-                f"/connections?api-version=2024-07-01-preview"
-            )
-            
-            headers = {
-                "Authorization": f"Bearer {token.token}",
-                "Content-Type": "application/json",
-            }
-            
-            response = httpx.get(url, headers=headers, timeout=30)
+            response = self._list_connections(project, token)
             response.raise_for_status()
             
             data = response.json()
@@ -447,25 +672,19 @@ class FoundryProvisionerService:
         Raises:
             ProvisioningError: If creation fails
         """
-        import httpx
-        from oyd_migrator.core.constants import AzureScopes
-        from oyd_migrator.core.config import get_settings
-
         settings = get_settings()
         location = location or settings.default_location
 
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
+            token = self._get_token(AzureScopes.MANAGEMENT)
 
-            url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
+            path = (
                 f"/resourceGroups/{resource_group}"
                 f"/providers/Microsoft.MachineLearningServices/workspaces/{name}"
-                f"?api-version=2024-04-01"
             )
 
             headers = {
-                "Authorization": f"Bearer {token.token}",
+                "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             }
 
@@ -481,7 +700,13 @@ class FoundryProvisionerService:
             if hub_resource_id:
                 body["properties"]["hubResourceId"] = hub_resource_id
 
-            response = httpx.put(url, headers=headers, json=body, timeout=120)
+            response = self._http.put(
+                path,
+                params={"api-version": ApiVersions.ML_WORKSPACES},
+                headers=headers,
+                json=body,
+                timeout=120,
+            )
 
             if response.status_code not in [200, 201, 202]:
                 raise ProvisioningError(
@@ -493,14 +718,12 @@ class FoundryProvisionerService:
             props = data.get("properties", {})
             endpoint = self._build_project_endpoint(data, props)
 
-            project = FoundryProject(
+            project = self._row_to_project(
                 name=name,
                 resource_name=name,
                 resource_group=resource_group,
-                subscription_id=self.subscription_id,
                 location=location,
                 endpoint=endpoint,
-                has_agent_service=True,
             )
 
             logger.info(f"Created Foundry project: {name}")
@@ -526,25 +749,25 @@ class FoundryProvisionerService:
         Returns:
             Foundry project if found
         """
-        import httpx
-        from oyd_migrator.core.constants import AzureScopes
-
         try:
-            token = self.credential.get_token(AzureScopes.MANAGEMENT)
+            token = self._get_token(AzureScopes.MANAGEMENT)
 
-            url = (
-                f"https://management.azure.com/subscriptions/{self.subscription_id}"
+            path = (
                 f"/resourceGroups/{resource_group}"
                 f"/providers/Microsoft.MachineLearningServices/workspaces/{name}"
-                f"?api-version=2024-04-01"
             )
 
             headers = {
-                "Authorization": f"Bearer {token.token}",
+                "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             }
 
-            response = httpx.get(url, headers=headers, timeout=30)
+            response = self._http.get(
+                path,
+                params={"api-version": ApiVersions.ML_WORKSPACES},
+                headers=headers,
+                timeout=30,
+            )
 
             if response.status_code == 404:
                 return None
@@ -555,14 +778,12 @@ class FoundryProvisionerService:
             props = data.get("properties", {})
             endpoint = self._build_project_endpoint(data, props)
 
-            return FoundryProject(
+            return self._row_to_project(
                 name=name,
                 resource_name=name,
                 resource_group=resource_group,
-                subscription_id=self.subscription_id,
                 location=data.get("location", ""),
                 endpoint=endpoint,
-                has_agent_service=True,
             )
 
         except Exception as e:
@@ -2,27 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
 from azure.core.credentials import TokenCredential
 from azure.mgmt.search import SearchManagementClient
 
 from oyd_migrator.core.constants import ApiVersions
 from oyd_migrator.core.exceptions import DiscoveryError
+from oyd_migrator.core.http_client import create_async_http_client, create_http_client
 from oyd_migrator.core.logging import get_logger
 from oyd_migrator.models.search import (
-    SearchService,
-    SearchIndex,
+    IndexAnalysis,
     IndexField,
+    SearchIndex,
+    SearchService,
     SemanticConfig,
-    SemanticPrioritizedFields,
-    SemanticField,
     VectorConfig,
     VectorSearchAlgorithm,
     VectorSearchProfile,
-    IndexAnalysis,
 )
 
 logger = get_logger("services.search_inventory")
 
+# Extracts the resource group name from an ARM resource ID
+_RESOURCE_GROUP_RE = re.compile(r"/resourceGroups/([^/]+)", re.IGNORECASE)
+
+SEARCH_DATA_PLANE_PARAMS = {"api-version": ApiVersions.SEARCH_DATA_PLANE}
+
+# Maximum concurrent $count requests per search service
+DOCUMENT_COUNT_CONCURRENCY = 10
+
+# Maximum search services inventoried at once by inventory_all
+INVENTORY_CONCURRENCY = 8
+
+# Worker threads used to fetch admin keys through the management SDK
+ADMIN_KEY_PREFETCH_WORKERS = 8
+
 
 class SearchInventoryService:
     """Service for inventorying Azure AI Search resources."""
@@ -38,6 +58,26 @@ class SearchInventoryService:
         self.credential = credential
         self.subscription_id = subscription_id
         self._mgmt_client = SearchManagementClient(credential, subscription_id)
+        self._services_by_name: dict[str, SearchService] | None = None
+        self._admin_keys: dict[str, str] = {}
+
+        # One pooled client for data plane calls so requests to the same
+        # search service reuse a single TLS connection
+        self._http = create_http_client(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+
+    def close(self) -> None:
+        """Close the data plane connection pool and the management client."""
+        self._http.close()
+        self._mgmt_client.close()
+
+    def __enter__(self) -> SearchInventoryService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def list_search_services(
         self, resource_group: str | None = None
@@ -62,7 +102,7 @@ class SearchInventoryService:
                 raw_services = self._mgmt_client.services.list_by_subscription()
 
             for svc in raw_services:
-                rg = svc.id.split("/resourceGroups/")[1].split("/")[0]
+                rg = _RESOURCE_GROUP_RE.search(svc.id).group(1)
 
                 # Get private endpoint connections
                 pe_connections = []
@@ -92,12 +132,18 @@ class SearchInventoryService:
 
         return services
 
-    def get_service_by_endpoint(self, endpoint: str) -> SearchService | None:
+    def get_service_by_endpoint(
+        self, endpoint: str, refresh: bool = False
+    ) -> SearchService | None:
         """
         Find a search service by its endpoint URL.
 
+        The subscription's services are listed once and cached by name, so
+        repeated lookups (e.g. one per OYD data source) cost a dict lookup.
+
         Args:
             endpoint: Search service endpoint URL
+            refresh: Re-list services instead of using the cached lookup
 
         Returns:
             Search service if found
@@ -105,66 +151,94 @@ class SearchInventoryService:
         # Extract service name from endpoint
         # Format: https://{service-name}.search.windows.net
         try:
-            import urllib.parse
             parsed = urllib.parse.urlparse(endpoint)
             service_name = parsed.netloc.split(".")[0]
 
-            services = self.list_search_services()
-            for service in services:
-                if service.name == service_name:
-                    return service
+            if refresh or self._services_by_name is None:
+                self._services_by_name = {
+                    service.name: service for service in self.list_search_services()
+                }
+
+            return self._services_by_name.get(service_name)
 
         except Exception as e:
             logger.warning(f"Could not find service for endpoint {endpoint}: {e}")
 
         return None
 
-    def get_indexes(self, service: SearchService) -> list[SearchIndex]:
+    def prefetch_admin_keys(self, services: list[SearchService]) -> None:
+        """
+        Fetch the admin keys of several search services in parallel.
+
+        Keys are cached so later get_indexes calls for these services skip
+        the management round trip. Failures are logged and left uncached.
+
+        Args:
+            services: Search services whose keys should be fetched
+        """
+        pending = [s for s in services if s.name not in self._admin_keys]
+        if not pending:
+            return
+
+        def fetch(service: SearchService) -> str | None:
+            try:
+                return self._fetch_admin_key(service)
+            except Exception as e:
+                logger.debug(f"Could not prefetch admin key for {service.name}: {e}")
+                return None
+
+        workers = min(ADMIN_KEY_PREFETCH_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for service, key in zip(pending, executor.map(fetch, pending), strict=True):
+                if key is not None:
+                    self._admin_keys[service.name] = key
+
+    def _fetch_admin_key(self, service: SearchService) -> str:
+        """Fetch a service's primary admin key via the management SDK."""
+        keys = self._mgmt_client.admin_keys.get(
+            resource_group_name=service.resource_group,
+            search_service_name=service.name,
+        )
+        return keys.primary_key
+
+    def _get_admin_key(self, service: SearchService) -> str:
+        """Return a service's admin key, fetching and caching it if needed."""
+        key = self._admin_keys.get(service.name)
+        if key is None:
+            key = self._admin_keys[service.name] = self._fetch_admin_key(service)
+        return key
+
+    def get_indexes(
+        self, service: SearchService, include_stats: bool = False
+    ) -> list[SearchIndex]:
         """
         Get all indexes for a search service.
 
         Args:
             service: Search service to query
+            include_stats: Also fetch each index's document count (one extra
+                request per index)
 
         Returns:
             List of indexes
         """
-        import httpx
-
         indexes = []
 
         try:
             # Get admin key for data plane access
-            keys = self._mgmt_client.admin_keys.get(
-                resource_group_name=service.resource_group,
-                search_service_name=service.name,
-            )
-            admin_key = keys.primary_key
+            headers = self._data_plane_headers(self._get_admin_key(service))
 
             # List indexes via data plane API
-            url = f"{service.endpoint}/indexes?api-version={ApiVersions.SEARCH_DATA_PLANE}"
-            headers = {
-                "api-key": admin_key,
-                "Content-Type": "application/json",
-            }
-
-            response = httpx.get(url, headers=headers, timeout=30)
+            response = self._http.get(self._indexes_url(service), headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for idx_data in data.get("value", []):
-                index = self._parse_index(service, idx_data)
-                indexes.append(index)
+                indexes.append(self._parse_index(service, idx_data))
 
-                # Get document count
-                stats_url = f"{service.endpoint}/indexes/{index.name}/docs/$count?api-version={ApiVersions.SEARCH_DATA_PLANE}"
-                try:
-                    stats_response = httpx.get(stats_url, headers=headers, timeout=10)
-                    if stats_response.status_code == 200:
-                        index.document_count = int(stats_response.text)
-                except Exception:
-                    pass
+            if include_stats:
+                self._fill_document_counts(service, indexes, headers)
 
             logger.debug(f"Found {len(indexes)} index(es) in {service.name}")
 
@@ -173,59 +247,198 @@ class SearchInventoryService:
 
         return indexes
 
-    def _parse_index(self, service: SearchService, data: dict) -> SearchIndex:
-        """Parse index data from API response."""
-        # Parse fields
-        fields = []
-        for field_data in data.get("fields", []):
-            field = IndexField(
-                name=field_data.get("name", ""),
-                type=field_data.get("type", ""),
-                searchable=field_data.get("searchable", False),
-                filterable=field_data.get("filterable", False),
-                sortable=field_data.get("sortable", False),
-                facetable=field_data.get("facetable", False),
-                retrievable=field_data.get("retrievable", True),
-                key=field_data.get("key", False),
-                dimensions=field_data.get("dimensions"),
-                vector_search_profile=field_data.get("vectorSearchProfile"),
-                analyzer=field_data.get("analyzer"),
-                search_analyzer=field_data.get("searchAnalyzer"),
-                index_analyzer=field_data.get("indexAnalyzer"),
-            )
-            fields.append(field)
-
-        # Parse semantic configurations
-        semantic_configs = []
-        semantic_data = data.get("semantic", {})
-        for config_data in semantic_data.get("configurations", []):
-            prioritized = config_data.get("prioritizedFields", {})
-
-            title_field = None
-            if prioritized.get("titleField"):
-                title_field = SemanticField(
-                    field_name=prioritized["titleField"].get("fieldName", "")
+    async def get_indexes_async(
+        self,
+        service: SearchService,
+        client: httpx.AsyncClient | None = None,
+        include_stats: bool = False,
+    ) -> list[SearchIndex]:
+        """
+        Get all indexes for a search service without blocking the event loop.
+
+        Args:
+            service: Search service to query
+            client: Optional shared async client (one is created if omitted)
+            include_stats: Also fetch each index's document count
+
+        Returns:
+            List of indexes
+        """
+        if client is None:
+            async with create_async_http_client(timeout=30) as client:
+                return await self.get_indexes_async(service, client, include_stats)
+
+        indexes = []
+
+        try:
+            # The management SDK client is synchronous, so run it in a worker thread
+            admin_key = self._admin_keys.get(service.name)
+            if admin_key is None:
+                admin_key = await asyncio.to_thread(self._get_admin_key, service)
+            headers = self._data_plane_headers(admin_key)
+
+            response = await client.get(self._indexes_url(service), headers=headers)
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+
+            for idx_data in data.get("value", []):
+                indexes.append(self._parse_index(service, idx_data))
+
+            if include_stats:
+                counts = await self._get_document_counts_async(
+                    service, [index.name for index in indexes], headers, client
                 )
+                for index, count in zip(indexes, counts, strict=True):
+                    index.document_count = count
 
-            content_fields = [
-                SemanticField(field_name=f.get("fieldName", ""))
-                for f in prioritized.get("contentFields", [])
-            ]
+            logger.debug(f"Found {len(indexes)} index(es) in {service.name}")
 
-            keyword_fields = [
-                SemanticField(field_name=f.get("fieldName", ""))
-                for f in prioritized.get("keywordFields", [])
-            ]
+        except Exception as e:
+            logger.warning(f"Could not get indexes for {service.name}: {e}")
 
-            semantic_config = SemanticConfig(
-                name=config_data.get("name", ""),
-                prioritized_fields=SemanticPrioritizedFields(
-                    title_field=title_field,
-                    content_fields=content_fields,
-                    keyword_fields=keyword_fields,
-                ),
-            )
-            semantic_configs.append(semantic_config)
+        return indexes
+
+    async def inventory_all(
+        self,
+        services: list[SearchService],
+        concurrency: int = INVENTORY_CONCURRENCY,
+        include_stats: bool = False,
+    ) -> list[list[SearchIndex]]:
+        """
+        Get the indexes of several search services concurrently.
+
+        Args:
+            services: Search services to query
+            concurrency: Maximum number of services queried at once
+            include_stats: Also fetch each index's document count
+
+        Returns:
+            Index lists in the same order as services
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Fetch every admin key up front instead of one per service slot
+        await asyncio.to_thread(self.prefetch_admin_keys, services)
+
+        async with create_async_http_client(timeout=30) as client:
+
+            async def bounded(service: SearchService) -> list[SearchIndex]:
+                async with semaphore:
+                    return await self.get_indexes_async(service, client, include_stats)
+
+            return await asyncio.gather(*(bounded(s) for s in services))
+
+    def _indexes_url(self, service: SearchService) -> httpx.URL:
+        """Build the data plane URL listing a service's indexes."""
+        return httpx.URL(f"{service.endpoint}/indexes", params=SEARCH_DATA_PLANE_PARAMS)
+
+    def _data_plane_headers(self, admin_key: str) -> dict[str, str]:
+        """Build data plane request headers for an admin key."""
+        return {
+            "api-key": admin_key,
+            "Content-Type": "application/json",
+        }
+
+    def _fill_document_counts(
+        self, service: SearchService, indexes: list[SearchIndex], headers: dict
+    ) -> None:
+        """
+        Populate document_count on each index.
+
+        The per-index $count requests are independent, so they are sent
+        concurrently; if that fails they are retried one at a time. When
+        called from inside a running event loop, where asyncio.run cannot
+        nest, they are sent one at a time (async callers should use
+        get_indexes_async instead).
+
+        Args:
+            service: Search service the indexes belong to
+            indexes: Indexes to update in place
+            headers: Data plane request headers (with api-key)
+        """
+        if not indexes:
+            return
+
+        names = [index.name for index in indexes]
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                counts = asyncio.run(self._get_document_counts_async(service, names, headers))
+            except Exception as e:
+                logger.debug(f"Concurrent document counts failed for {service.name}, retrying sequentially: {e}")
+                counts = [self._get_document_count(service, name, headers) for name in names]
+        else:
+            counts = [self._get_document_count(service, name, headers) for name in names]
+
+        for index, count in zip(indexes, counts, strict=True):
+            index.document_count = count
+
+    async def _get_document_counts_async(
+        self,
+        service: SearchService,
+        index_names: list[str],
+        headers: dict,
+        client: httpx.AsyncClient | None = None,
+    ) -> list[int | None]:
+        """
+        Fetch document counts for several indexes concurrently.
+
+        All requests target the same search service host, so over HTTP/2 they
+        are multiplexed as concurrent streams on a single connection.
+        """
+        if client is None:
+            async with create_async_http_client(timeout=10) as client:
+                return await self._get_document_counts_async(service, index_names, headers, client)
+
+        semaphore = asyncio.Semaphore(DOCUMENT_COUNT_CONCURRENCY)
+
+        async def count(index_name: str) -> int | None:
+            async with semaphore:
+                try:
+                    response = await client.get(
+                        self._count_url(service, index_name), headers=headers, timeout=10
+                    )
+                    if response.status_code == 200:
+                        return int(response.text)
+                except Exception:
+                    pass
+                return None
+
+        return await asyncio.gather(*(count(name) for name in index_names))
+
+    def _get_document_count(
+        self, service: SearchService, index_name: str, headers: dict
+    ) -> int | None:
+        """Fetch the document count for a single index."""
+        try:
+            response = self._http.get(self._count_url(service, index_name), headers=headers, timeout=10)
+            if response.status_code == 200:
+                return int(response.text)
+        except Exception:
+            pass
+        return None
+
+    def _count_url(self, service: SearchService, index_name: str) -> httpx.URL:
+        """Build the data plane $count URL for an index."""
+        return httpx.URL(
+            f"{service.endpoint}/indexes/{urllib.parse.quote(index_name, safe='')}/docs/$count",
+            params=SEARCH_DATA_PLANE_PARAMS,
+        )
+
+    def _parse_index(self, service: SearchService, data: dict) -> SearchIndex:
+        """Parse index data from API response."""
+        # Fields and semantic configurations are validated directly from the
+        # camelCase payload via the models' API aliases
+        fields = [IndexField.model_validate(f) for f in data.get("fields", [])]
+
+        semantic_data = data.get("semantic") or {}
+        semantic_configs = [
+            SemanticConfig.model_validate(config_data)
+            for config_data in semantic_data.get("configurations", [])
+        ]
 
         # Parse vector search configuration
         vector_config = None
@@ -241,11 +454,7 @@ class SearchInventoryService:
             ]
 
             profiles = [
-                VectorSearchProfile(
-                    name=prof.get("name", ""),
-                    algorithm_configuration_name=prof.get("algorithmConfigurationName", ""),
-                    vectorizer_name=prof.get("vectorizerName"),
-                )
+                VectorSearchProfile.model_validate(prof)
                 for prof in vector_data.get("profiles", [])
             ]
 
@@ -275,14 +484,27 @@ class SearchInventoryService:
         Returns:
             Analysis results with recommendations
         """
+        # Tally field kinds in one pass instead of one helper call per kind
+        text_fields = vector_fields = filterable_fields = 0
+        has_retrievable = False
+        for field in index.fields:
+            if field.is_text_field:
+                text_fields += 1
+            if field.is_vector_field:
+                vector_fields += 1
+            if field.filterable:
+                filterable_fields += 1
+            if field.retrievable:
+                has_retrievable = True
+
         analysis = IndexAnalysis(
             index_name=index.name,
             total_fields=len(index.fields),
-            text_fields=len(index.get_text_fields()),
-            vector_fields=len(index.get_vector_fields()),
-            filterable_fields=len([f for f in index.fields if f.filterable]),
+            text_fields=text_fields,
+            vector_fields=vector_fields,
+            filterable_fields=filterable_fields,
             supports_semantic=index.has_semantic_search(),
-            supports_vector=index.has_vector_search(),
+            supports_vector=vector_fields > 0,
         )
 
         # Determine hybrid support (requires vector + text for basic hybrid,
@@ -295,14 +517,14 @@ class SearchInventoryService:
         )
 
         # Check compatibility
-        if not index.get_text_fields():
+        if not text_fields:
             analysis.compatible_with_search_tool = False
             analysis.compatible_with_knowledge_base = False
             analysis.compatibility_issues.append(
                 "No searchable text fields found. At least one is required."
             )
 
-        if not index.get_retrievable_fields():
+        if not has_retrievable:
             analysis.compatibility_issues.append(
                 "No retrievable fields found. Citations may not work properly."
             )
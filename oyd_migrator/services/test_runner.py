@@ -2,32 +2,168 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
 import time
+from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
 
-from azure.core.credentials import TokenCredential
-
-from oyd_migrator.core.constants import ApiVersions
-from oyd_migrator.core.exceptions import ValidationError
+import httpx
+import orjson
+from azure.core.credentials import AccessToken, TokenCredential
+
+from oyd_migrator.core.constants import ApiVersions, AzureScopes
+from oyd_migrator.core.http_client import (
+    DEADLINE_EXTENSION,
+    MAX_RETRIES,
+    create_async_http_client,
+    create_http_client,
+)
 from oyd_migrator.core.logging import get_logger
 from oyd_migrator.models.migration import TestResult
 
 logger = get_logger("services.test_runner")
 
+# Default number of test queries in flight at once per suite
+DEFAULT_MAX_CONCURRENCY = 5
+
+# The cached token is refreshed this many seconds before it expires
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Per-phase limits for test requests; the read limit is the caller's timeout
+CONNECT_TIMEOUT_SECONDS = 5.0
+WRITE_TIMEOUT_SECONDS = 10.0
+POOL_TIMEOUT_SECONDS = 5.0
+
+# A response check returns an issue description, or None when it passes
+ResponseValidator = Callable[[TestResult], "str | None"]
+
+
+def _check_response_text(result: TestResult) -> str | None:
+    return None if result.response_text else "Empty response received"
+
+
+def _check_citations(result: TestResult) -> str | None:
+    return None if result.has_citations else "No citations in response"
+
+
+def _check_tool_calls(result: TestResult) -> str | None:
+    return None if result.tool_calls_count else "No tool calls made"
+
+
+class RateLimiter:
+    """
+    Async sliding-window rate limiter.
+
+    At most ``burst`` requests start within any ``burst / qps`` second
+    window: each permit is handed back on a timer rather than when the
+    request finishes, so the sustained rate stays at ``qps``.
+    """
+
+    def __init__(self, qps: float, burst: int = 1) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            qps: Sustained requests per second
+            burst: Requests allowed to start back to back
+        """
+        self._window = burst / qps
+        self._semaphore = asyncio.Semaphore(burst)
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        asyncio.get_running_loop().call_later(self._window, self._semaphore.release)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
 
 class AgentTestRunner:
     """Service for testing Foundry agents."""
 
-    def __init__(self, credential: TokenCredential, project_endpoint: str) -> None:
+    _DEFAULT_QUERIES: tuple[str, ...] = (
+        "What information do you have available?",
+        "Can you provide a summary of the main topics?",
+        "What are the key points I should know about?",
+    )
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        project_endpoint: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        qps: float | None = None,
+        burst: int = 1,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
         """
         Initialize the test runner.
 
         Args:
             credential: Azure credential
             project_endpoint: Foundry project endpoint URL
+            max_concurrency: Maximum test queries in flight at once
+            qps: Optional cap on test queries started per second
+            burst: Queries allowed to start back to back under the qps cap
+            max_retries: Retries of a throttled (429) or unconnectable query
+                before the test is marked failed; queries are POSTs, so
+                timeouts and 5xx responses are not resent
         """
         self.credential = credential
         self.project_endpoint = project_endpoint
+        self.max_concurrency = max_concurrency
+        self.qps = qps
+        self.burst = burst
+        self.max_retries = max_retries
+        self._token: AccessToken | None = None
+        self._token_lock = threading.Lock()
+        self._auth_headers: dict[str, str] = {}
+
+        # Request URLs only depend on the endpoint, so build them once
+        self._conversations_url = (
+            f"{project_endpoint}/openai/conversations?api-version={ApiVersions.RESPONSES_PREVIEW}"
+        )
+        self._responses_url = (
+            f"{project_endpoint}/openai/responses?api-version={ApiVersions.RESPONSES_PREVIEW}"
+        )
+
+        # Pooled client so sequential test_agent calls reuse one connection
+        self._http = create_http_client(
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            max_retries=max_retries,
+        )
+
+    def _get_token(self) -> str:
+        """
+        Get an AI Foundry bearer token, reusing the cached one until near expiry.
+
+        Returns:
+            Access token string
+        """
+        with self._token_lock:
+            if (
+                self._token is None
+                or self._token.expires_on - time.time() <= TOKEN_REFRESH_MARGIN_SECONDS
+            ):
+                self._token = self.credential.get_token(AzureScopes.AI_FOUNDRY)
+                self._auth_headers = {
+                    "Authorization": f"Bearer {self._token.token}",
+                    "Content-Type": "application/json",
+                }
+            return self._token.token
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> AgentTestRunner:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def test_agent(
         self,
@@ -46,100 +182,198 @@ class AgentTestRunner:
         Returns:
             Test result
         """
-        result = TestResult(
-            agent_name=agent_name,
-            query=query,
-            timestamp=datetime.now(timezone.utc),
-        )
-
+        result = self._new_result(agent_name, query)
         start_time = time.time()
 
         try:
-            import httpx
-            from oyd_migrator.core.constants import AzureScopes
-
-            token = self.credential.get_token(AzureScopes.AI_FOUNDRY)
-
-            # Create a conversation/thread
-            thread_url = f"{self.project_endpoint}/openai/conversations?api-version=2025-11-15-preview"
+            # The deadline bounds the whole call, throttle retries included,
+            # as wait_for does on the async path
+            response = self._http.post(
+                **self._response_request(agent_name, query),
+                timeout=self._request_timeout(timeout_seconds),
+                extensions={DEADLINE_EXTENSION: time.monotonic() + timeout_seconds},
+            )
+            response.raise_for_status()
+            self._record_response(result, orjson.loads(response.content))
+        except Exception as e:
+            self._record_error(result, e, timeout_seconds)
 
-            headers = {
-                "Authorization": f"Bearer {token.token}",
-                "Content-Type": "application/json",
-            }
+        # Calculate response time
+        result.response_time_ms = (time.time() - start_time) * 1000
 
-            thread_response = httpx.post(
-                thread_url, headers=headers, json={}, timeout=30
-            )
-            thread_response.raise_for_status()
-            thread_data = thread_response.json()
-            conversation_id = thread_data.get("id")
-
-            # Send query to agent
-            response_url = f"{self.project_endpoint}/openai/responses?api-version=2025-11-15-preview"
-
-            body = {
-                "conversation": conversation_id,
-                "input": query,
-                "agent": {
-                    "name": agent_name,
-                    "type": "agent_reference",
-                },
-            }
-
-            response = httpx.post(
-                response_url,
-                headers=headers,
-                json=body,
-                timeout=timeout_seconds,
-            )
+        return result
 
-            response.raise_for_status()
-            data = response.json()
+    async def test_agent_async(
+        self,
+        agent_name: str,
+        query: str,
+        timeout_seconds: int = 60,
+        client: httpx.AsyncClient | None = None,
+    ) -> TestResult:
+        """
+        Test an agent with a query without blocking the event loop.
 
-            # Parse response
-            result.success = True
-            result.response_text = data.get("output_text", "")
+        Args:
+            agent_name: Name of the agent to test
+            query: Test query to send
+            timeout_seconds: Maximum time to wait for response
+            client: Optional shared async client (one is created if omitted)
 
-            # Count tool calls
-            tool_calls = data.get("tool_calls", [])
-            result.tool_calls_count = len(tool_calls)
-            result.tool_types = list(set(tc.get("type", "") for tc in tool_calls))
+        Returns:
+            Test result
+        """
+        if client is None:
+            async with create_async_http_client(
+                timeout=60, max_retries=self.max_retries
+            ) as client:
+                return await self._send_query(
+                    agent_name, query, client, timeout_seconds=timeout_seconds
+                )
 
-            # Check for citations
-            citations = data.get("citations", [])
-            result.citation_count = len(citations)
-            result.has_citations = len(citations) > 0
+        return await self._send_query(agent_name, query, client, timeout_seconds=timeout_seconds)
 
-            # Token usage
-            usage = data.get("usage", {})
-            result.total_tokens = usage.get("total_tokens", 0)
+    async def _send_query(
+        self,
+        agent_name: str,
+        query: str,
+        client: httpx.AsyncClient,
+        conversation_id: str | None = None,
+        timeout_seconds: int = 60,
+    ) -> TestResult:
+        """
+        Send one query to the agent and record the outcome.
 
-        except httpx.TimeoutException:
-            result.success = False
-            result.error_message = f"Request timed out after {timeout_seconds}s"
-            result.error_type = "timeout"
+        Args:
+            agent_name: Name of the agent to test
+            query: Test query to send
+            client: Async client to send the request with
+            conversation_id: Conversation to add the turn to, if any
+            timeout_seconds: Maximum time to wait for response
 
-        except httpx.HTTPStatusError as e:
-            result.success = False
-            result.error_message = f"HTTP error: {e.response.status_code}"
-            result.error_type = "http_error"
+        Returns:
+            Test result
+        """
+        result = self._new_result(agent_name, query)
+        start_time = time.time()
 
+        try:
+            # wait_for enforces the overall budget across retries and phases
+            response = await asyncio.wait_for(
+                client.post(
+                    **self._response_request(agent_name, query, conversation_id),
+                    timeout=self._request_timeout(timeout_seconds),
+                ),
+                timeout=timeout_seconds,
+            )
+            response.raise_for_status()
+            self._record_response(result, orjson.loads(response.content))
         except Exception as e:
-            result.success = False
-            result.error_message = str(e)
-            result.error_type = "exception"
-            logger.warning(f"Test failed for {agent_name}: {e}")
+            self._record_error(result, e, timeout_seconds)
 
         # Calculate response time
         result.response_time_ms = (time.time() - start_time) * 1000
 
         return result
 
+    def _request_timeout(self, timeout_seconds: float) -> httpx.Timeout:
+        """Build per-phase timeouts so a stalled connect fails fast."""
+        return httpx.Timeout(
+            connect=CONNECT_TIMEOUT_SECONDS,
+            read=timeout_seconds,
+            write=WRITE_TIMEOUT_SECONDS,
+            pool=POOL_TIMEOUT_SECONDS,
+        )
+
+    def _new_result(self, agent_name: str, query: str) -> TestResult:
+        """Create an empty result for a test query."""
+        return TestResult(
+            agent_name=agent_name,
+            query=query,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    def _headers(self) -> dict[str, str]:
+        """Get request headers carrying a current bearer token."""
+        # Rebuilt only when _get_token refreshes the token
+        self._get_token()
+        return self._auth_headers
+
+    def _response_request(
+        self, agent_name: str, query: str, conversation_id: str | None = None
+    ) -> dict:
+        """
+        Build the URL, headers and body of a Responses API request.
+
+        A single-turn test needs no conversation: the Responses API accepts
+        standalone requests, which saves the conversation-create round trip
+        (conversation ids are server-issued, so one cannot be generated
+        client-side).
+
+        Args:
+            agent_name: Name of the agent to test
+            query: Test query to send
+            conversation_id: Conversation to add the turn to, if any
+
+        Returns:
+            Keyword arguments for an httpx post call
+        """
+        body: dict = {
+            "input": query,
+            "agent": {
+                "name": agent_name,
+                "type": "agent_reference",
+            },
+        }
+        if conversation_id:
+            body["conversation"] = conversation_id
+
+        return {
+            "url": self._responses_url,
+            "headers": self._headers(),
+            "json": body,
+        }
+
+    def _record_response(self, result: TestResult, data: dict) -> None:
+        """Fill a test result from a successful Responses API payload."""
+        # Missing or null collections fall back to shared empty constants
+        tool_calls = data.get("tool_calls") or ()
+        citation_count = len(data.get("citations") or ())
+        usage = data.get("usage") or {}
+
+        result.success = True
+        result.response_text = data.get("output_text", "")
+        result.tool_calls_count = len(tool_calls)
+        # dict.fromkeys dedupes while keeping first-seen order
+        result.tool_types = list(dict.fromkeys(tc.get("type", "") for tc in tool_calls))
+        result.citation_count = citation_count
+        result.has_citations = citation_count > 0
+        result.total_tokens = usage.get("total_tokens", 0)
+
+    def _record_error(
+        self, result: TestResult, error: Exception, timeout_seconds: int
+    ) -> None:
+        """Mark a test result as failed and classify the error."""
+        result.success = False
+
+        if isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError)):
+            result.error_message = f"Request timed out after {timeout_seconds}s"
+            result.error_type = "timeout"
+        elif isinstance(error, httpx.HTTPStatusError):
+            # Keep the start of the service's error body for diagnosis
+            result.error_message = (
+                f"HTTP {error.response.status_code}: {error.response.text[:200]}"
+            )
+            result.error_type = "http_error"
+        else:
+            result.error_message = str(error)
+            result.error_type = "exception"
+            logger.warning(f"Test failed for {result.agent_name}: {error}")
+
     def run_test_suite(
         self,
         agent_name: str,
         queries: list[str],
+        shared_conversation: bool = False,
     ) -> list[TestResult]:
         """
         Run multiple test queries against an agent.
@@ -147,20 +381,93 @@ class AgentTestRunner:
         Args:
             agent_name: Name of the agent to test
             queries: List of test queries
+            shared_conversation: Send the queries as successive turns of one
+                conversation instead of independent requests
 
         Returns:
             List of test results
         """
-        results = []
+        return asyncio.run(
+            self.run_test_suite_async(agent_name, queries, shared_conversation)
+        )
+
+    async def run_test_suite_async(
+        self,
+        agent_name: str,
+        queries: list[str],
+        shared_conversation: bool = False,
+    ) -> list[TestResult]:
+        """
+        Run multiple test queries against an agent concurrently.
+
+        All queries share one pooled HTTP/2 client, with at most
+        max_concurrency in flight and, when qps is set, starts paced by a
+        RateLimiter. Throttled requests back off individually (honouring
+        Retry-After) in the client's retry transport.
+
+        With shared_conversation, one conversation is created up front and
+        the queries are sent as ordered turns in it, so they run one at a time.
+
+        Args:
+            agent_name: Name of the agent to test
+            queries: List of test queries
+            shared_conversation: Send the queries as turns of one conversation
 
-        for query in queries:
-            result = self.test_agent(agent_name, query)
-            results.append(result)
+        Returns:
+            Test results in the same order as queries
+        """
+        async with create_async_http_client(
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            max_retries=self.max_retries,
+        ) as client:
+            if shared_conversation:
+                return await self._run_conversation(agent_name, queries, client)
 
-            # Small delay between requests to avoid rate limiting
-            time.sleep(0.5)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            limiter = RateLimiter(self.qps, self.burst) if self.qps else contextlib.nullcontext()
 
-        return results
+            async def bounded(query: str) -> TestResult:
+                async with semaphore, limiter:
+                    return await self.test_agent_async(agent_name, query, client=client)
+
+            return await asyncio.gather(*(bounded(query) for query in queries))
+
+    async def _run_conversation(
+        self, agent_name: str, queries: list[str], client: httpx.AsyncClient
+    ) -> list[TestResult]:
+        """Send queries as successive turns of a single new conversation."""
+        try:
+            conversation_id = await self._create_conversation(client)
+        except Exception as e:
+            results = [self._new_result(agent_name, query) for query in queries]
+            for result in results:
+                self._record_error(result, e, timeout_seconds=30)
+            return results
+
+        return [
+            await self._send_query(agent_name, query, client, conversation_id)
+            for query in queries
+        ]
+
+    async def _create_conversation(self, client: httpx.AsyncClient) -> str:
+        """
+        Create a conversation to hold several test turns.
+
+        Args:
+            client: Async client to send the request with
+
+        Returns:
+            Server-issued conversation ID
+        """
+        response = await client.post(
+            self._conversations_url,
+            headers=self._headers(),
+            json={},
+            timeout=30,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)["id"]
 
     def generate_test_queries(self, context: str = "") -> list[str]:
         """
@@ -172,16 +479,44 @@ class AgentTestRunner:
         Returns:
             List of test queries
         """
-        base_queries = [
-            "What information do you have available?",
-            "Can you provide a summary of the main topics?",
-            "What are the key points I should know about?",
-        ]
+        if not context:
+            return list(self._DEFAULT_QUERIES)
+
+        return [*self._DEFAULT_QUERIES, f"Tell me about {context}"]
+
+    @classmethod
+    def compile_validators(
+        cls,
+        require_citations: bool = True,
+        require_tool_calls: bool = True,
+    ) -> tuple[ResponseValidator, ...]:
+        """
+        Build the response checks active for a set of requirements.
 
-        if context:
-            base_queries.append(f"Tell me about {context}")
+        Args:
+            require_citations: Require citations in response
+            require_tool_calls: Require tool calls to be made
+
+        Returns:
+            Checks to run, in reporting order
+        """
+        validators: list[ResponseValidator] = [_check_response_text]
+        if require_citations:
+            validators.append(_check_citations)
+        if require_tool_calls:
+            validators.append(_check_tool_calls)
+        return tuple(validators)
+
+    @staticmethod
+    def _apply_validators(
+        result: TestResult, validators: tuple[ResponseValidator, ...]
+    ) -> tuple[bool, list[str]]:
+        """Run compiled checks against one result."""
+        if not result.success:
+            return False, [f"Request failed: {result.error_message}"]
 
-        return base_queries
+        issues = [issue for check in validators if (issue := check(result)) is not None]
+        return not issues, issues
 
     def validate_agent_response(
         self,
@@ -200,19 +535,25 @@ class AgentTestRunner:
         Returns:
             Tuple of (is_valid, issues)
         """
-        issues = []
-
-        if not result.success:
-            issues.append(f"Request failed: {result.error_message}")
-            return False, issues
+        validators = self.compile_validators(require_citations, require_tool_calls)
+        return self._apply_validators(result, validators)
 
-        if not result.response_text:
-            issues.append("Empty response received")
-
-        if require_citations and not result.has_citations:
-            issues.append("No citations in response")
+    def batch_validate(
+        self,
+        results: Iterable[TestResult],
+        require_citations: bool = True,
+        require_tool_calls: bool = True,
+    ) -> list[tuple[bool, list[str]]]:
+        """
+        Validate many responses against the same requirements.
 
-        if require_tool_calls and result.tool_calls_count == 0:
-            issues.append("No tool calls made")
+        Args:
+            results: Test results to validate
+            require_citations: Require citations in response
+            require_tool_calls: Require tool calls to be made
 
-        return len(issues) == 0, issues
+        Returns:
+            (is_valid, issues) per result, in input order
+        """
+        validators = self.compile_validators(require_citations, require_tool_calls)
+        return [self._apply_validators(result, validators) for result in results]
@@ -1,28 +1,50 @@
 """Pytest configuration and fixtures."""
 
+import time
+from collections import namedtuple
+
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock
+
+
+AccessTokenStub = namedtuple("AccessTokenStub", "token expires_on")
+
+
+class StubCredential:
+    """Lightweight TokenCredential stand-in that counts get_token calls."""
+
+    def __init__(self, token: str = "mock-token") -> None:
+        self.token = token
+        self.get_token_calls = 0
+
+    def get_token(self, *scopes, **kwargs) -> AccessTokenStub:
+        self.get_token_calls += 1
+        return AccessTokenStub(self.token, int(time.time()) + 3600)
 
 
 @pytest.fixture
 def mock_credential():
-    """Create a mock Azure credential."""
-    credential = MagicMock()
-    credential.get_token.return_value = MagicMock(token="mock-token")
-    return credential
+    """Create a stub Azure credential."""
+    return StubCredential()
 
 
-@pytest.fixture
+def _guard_unmutated(model):
+    """Yield a shared model and fail at teardown if any test mutated it."""
+    snapshot = model.model_dump()
+    yield model
+    assert model.model_dump() == snapshot, f"shared {type(model).__name__} fixture was mutated"
+
+
+@pytest.fixture(scope="session")
 def sample_oyd_config():
-    """Create a sample OYD configuration."""
+    """Create a sample OYD configuration (shared; tests must not mutate it)."""
     from oyd_migrator.models.oyd import (
         OYDConfiguration,
         OYDAzureSearchSource,
         OYDFieldMapping,
     )
 
-    return OYDConfiguration(
+    config = OYDConfiguration(
         deployment_name="gpt-4o-deployment",
         model="gpt-4o",
         data_sources=[
@@ -43,11 +65,12 @@ def sample_oyd_config():
             ),
         ],
     )
+    yield from _guard_unmutated(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_index():
-    """Create a sample search index."""
+    """Create a sample search index (shared; tests must not mutate it)."""
     from oyd_migrator.models.search import (
         SearchIndex,
         IndexField,
@@ -56,7 +79,7 @@ def sample_search_index():
         SemanticField,
     )
 
-    return SearchIndex(
+    index = SearchIndex(
         name="products-index",
         service_name="test-search",
         service_endpoint="https://test-search.search.windows.net",
@@ -82,6 +105,7 @@ def sample_search_index():
         ],
         document_count=1000,
     )
+    yield from _guard_unmutated(index)
 
 
 @pytest.fixture
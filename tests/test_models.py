@@ -3,6 +3,11 @@
 import pytest
 from datetime import datetime
 
+from oyd_migrator.core.config import AzureConfig, MigrationState
+from oyd_migrator.core.constants import AuthMethod
+# Aliased so pytest does not try to collect the model as a test class
+from oyd_migrator.models.migration import TestResult as AgentTestResult
+
 
 class TestOYDModels:
     """Tests for OYD data models."""
@@ -69,8 +74,6 @@ class TestMigrationModels:
 
     def test_migration_state_creation(self):
         """Test creating migration state."""
-        from oyd_migrator.core.config import MigrationState
-
         state = MigrationState(session_id="test-123")
         assert state.session_id == "test-123"
         assert state.current_stage == "auth"
@@ -78,9 +81,6 @@ class TestMigrationModels:
 
     def test_migration_state_save_load(self, temp_config_dir):
         """Test saving and loading migration state."""
-        from oyd_migrator.core.config import MigrationState, AzureConfig
-        from oyd_migrator.core.constants import AuthMethod
-
         # Create and save state
         state = MigrationState(
             session_id="test-456",
@@ -99,9 +99,7 @@ class TestMigrationModels:
 
     def test_test_result_creation(self):
         """Test creating test result."""
-        from oyd_migrator.models.migration import TestResult
-
-        result = TestResult(
+        result = AgentTestResult(
             agent_name="test-agent",
             query="What is the answer?",
             success=True,
@@ -0,0 +1,664 @@
+"""Tests for service-layer behavior that does not require Azure access."""
+
+import asyncio
+import time
+import warnings
+from unittest.mock import MagicMock
+
+import httpx
+import orjson
+import pytest
+
+from oyd_migrator.core import http_client
+from oyd_migrator.core.constants import ApiVersions
+from oyd_migrator.models.foundry import FoundryProject
+from oyd_migrator.models.migration import TestResult as AgentTestResult  # not a test class
+from oyd_migrator.models.search import SearchIndex, SearchService
+from oyd_migrator.services.foundry_provisioner import FoundryProvisionerService
+from oyd_migrator.services.search_inventory import SearchInventoryService
+from oyd_migrator.services.test_runner import AgentTestRunner, RateLimiter
+
+SUB = "00000000-0000-0000-0000-000000000000"
+
+
+def _search_service(name):
+    """Build a SearchService on the test subscription that differs only by name."""
+    return SearchService(
+        name=name, resource_group="rg", subscription_id=SUB, location="eastus",
+        endpoint=f"https://{name}.search.windows.net", sku="basic",
+    )
+
+
+@pytest.fixture
+def search_service():
+    """The single "svc" search service most inventory tests run against."""
+    return _search_service("svc")
+
+
+@pytest.fixture
+def fake_async_client(monkeypatch):
+    """Install a handler behind every httpx.AsyncClient the code under test creates."""
+    real_async_client = httpx.AsyncClient
+
+    def install(handler):
+        monkeypatch.setattr(
+            httpx, "AsyncClient",
+            lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler)),
+        )
+
+    return install
+
+
+# ---------------------------------------------------------------------------
+# FoundryProvisionerService
+# ---------------------------------------------------------------------------
+
+class TestFoundryResourceGraphListing:
+    """Tests for the Resource Graph backed project/account listing."""
+
+    ROWS = [
+        {
+            "id": f"/subscriptions/{SUB}/resourceGroups/rg-ml/providers/"
+                  "Microsoft.MachineLearningServices/workspaces/ml-proj",
+            "name": "ml-proj",
+            "type": "microsoft.machinelearningservices/workspaces",
+            "kind": "Project",
+            "location": "eastus",
+            "properties": {
+                "hubResourceId": f"/subscriptions/{SUB}/resourceGroups/rg-ml/providers/"
+                                 "Microsoft.MachineLearningServices/workspaces/my-hub",
+            },
+        },
+        {
+            "id": f"/subscriptions/{SUB}/resourceGroups/rg-ml/providers/"
+                  "Microsoft.MachineLearningServices/workspaces/my-hub",
+            "name": "my-hub",
+            "type": "microsoft.machinelearningservices/workspaces",
+            "kind": "Hub",
+            "location": "eastus",
+            "properties": {},
+        },
+        {
+            "id": f"/subscriptions/{SUB}/resourceGroups/rg-cs/providers/"
+                  "Microsoft.CognitiveServices/accounts/acct/projects/cs-proj",
+            "name": "acct/cs-proj",
+            "type": "microsoft.cognitiveservices/accounts/projects",
+            "kind": None,
+            "location": "westus",
+            "properties": {},
+        },
+    ]
+
+    @pytest.fixture
+    def provisioner(self, mock_credential, monkeypatch):
+        svc = FoundryProvisionerService(mock_credential, SUB)
+        calls = []
+
+        def fake_query(query):
+            calls.append(query)
+            return self.ROWS
+
+        monkeypatch.setattr(svc, "_query_resource_graph", fake_query)
+        svc.graph_calls = calls
+        return svc
+
+    def test_partitions_projects_and_accounts(self, provisioner):
+        projects = provisioner.list_projects()
+        accounts = provisioner.list_foundry_accounts()
+
+        assert [p.name for p in projects] == ["ml-proj", "cs-proj"]
+        assert projects[0].resource_name == "my-hub"
+        assert projects[0].endpoint == "https://my-hub.services.ai.azure.com/api/projects/ml-proj"
+        assert projects[1].resource_name == "acct"
+        assert projects[1].resource_group == "rg-cs"
+        assert projects[1].endpoint == "https://acct.services.ai.azure.com/api/projects/cs-proj"
+
+        assert [a.name for a in accounts] == ["my-hub"]
+        assert accounts[0].has_agent_service is False
+
+    def test_single_query_for_projects_and_accounts(self, provisioner):
+        provisioner.list_projects()
+        provisioner.list_foundry_accounts()
+        assert len(provisioner.graph_calls) == 1
+
+
+class TestResolveProjectEndpoints:
+    """Tests for AI Services endpoint resolution from project connections."""
+
+    @staticmethod
+    def _project(name):
+        return FoundryProject(
+            name=name, resource_name=name, resource_group="rg", subscription_id=SUB,
+            location="eastus", endpoint=f"https://{name}.services.ai.azure.com/api/projects/{name}",
+        )
+
+    def test_prefers_ai_services_over_openai(self, mock_credential):
+        svc = FoundryProvisionerService(mock_credential, SUB)
+        data = {"value": [
+            {"properties": {"category": "AzureOpenAI", "target": "https://x.openai.azure.com/"}},
+            {"properties": {"category": "AIServices", "target": "https://ai.cognitiveservices.azure.com/"}},
+        ]}
+        assert svc._select_ai_services_target(self._project("p"), data) == (
+            "https://ai.cognitiveservices.azure.com/"
+        )
+
+    def test_openai_fallback_is_converted(self, mock_credential):
+        svc = FoundryProvisionerService(mock_credential, SUB)
+        data = {"value": [
+            {"properties": {"category": "AzureOpenAI", "target": "https://x.openai.azure.com/"}},
+        ]}
+        assert svc._select_ai_services_target(self._project("p"), data) == (
+            "https://x.cognitiveservices.azure.com/"
+        )
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [(200, "https://p-ai.example.com/"), (404, None)],
+        ids=["resolved", "falls_back"],
+    )
+    def test_resolve_project_endpoint(self, mock_credential, status, expected):
+        def handler(request):
+            assert request.url.host == "management.azure.com"
+            assert request.url.path == (
+                f"/subscriptions/{SUB}/resourceGroups/rg"
+                "/providers/Microsoft.MachineLearningServices/workspaces/p/connections"
+            )
+            assert request.url.params["api-version"] == ApiVersions.FOUNDRY_CONNECTIONS
+            return httpx.Response(status, json={"value": [
+                {"properties": {"category": "AIServices", "target": "https://p-ai.example.com/"}},
+            ]})
+
+        svc = FoundryProvisionerService(mock_credential, SUB)
+        svc._http._transport._transport = httpx.MockTransport(handler)
+        project = self._project("p")
+
+        assert svc.resolve_project_endpoint(project) == (expected or project.endpoint)
+
+
+# ---------------------------------------------------------------------------
+# SearchInventoryService
+# ---------------------------------------------------------------------------
+
+class TestSearchDocumentCounts:
+    """Tests for index document count retrieval."""
+
+    def test_counts_fetched_per_index(self, search_service, fake_async_client):
+        def handler(request):
+            name = request.url.path.split("/indexes/")[1].split("/")[0]
+            if name == "broken":
+                return httpx.Response(500)
+            return httpx.Response(200, text=str(len(name)))
+
+        fake_async_client(handler)
+
+        indexes = [
+            SearchIndex(name=n, service_name="svc", service_endpoint=search_service.endpoint)
+            for n in ("abc", "broken", "abcdef")
+        ]
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        svc._fill_document_counts(search_service, indexes, {"api-key": "k"})
+
+        assert [i.document_count for i in indexes] == [3, None, 6]
+
+    def test_counts_sequential_inside_running_loop(self, search_service):
+        def handler(request):
+            name = request.url.path.split("/indexes/")[1].split("/")[0]
+            return httpx.Response(200, text=str(len(name)))
+
+        indexes = [
+            SearchIndex(name=n, service_name="svc", service_endpoint=search_service.endpoint)
+            for n in ("abc", "abcdef")
+        ]
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        svc._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+        async def caller():
+            svc._fill_document_counts(search_service, indexes, {"api-key": "k"})
+
+        with warnings.catch_warnings():
+            # A never-awaited coroutine would surface as a RuntimeWarning
+            warnings.simplefilter("error", RuntimeWarning)
+            asyncio.run(caller())
+
+        assert [i.document_count for i in indexes] == [3, 6]
+
+
+class TestProvisionerTokenCache:
+    """Tests for FoundryProvisionerService token reuse."""
+
+    def test_token_reused_until_near_expiry(self, mock_credential):
+        svc = FoundryProvisionerService(mock_credential, SUB)
+        assert svc._get_token("scope") == "mock-token"
+        assert svc._get_token("scope") == "mock-token"
+        assert mock_credential.get_token_calls == 1
+
+        mock_credential.token = "fresh-token"
+        svc._token_cache["scope"] = ("stale-token", time.time() + 30)
+        assert svc._get_token("scope") == "fresh-token"
+
+
+class TestSearchServiceLookup:
+    """Tests for SearchInventoryService.get_service_by_endpoint caching."""
+
+    def test_services_listed_once(self, monkeypatch):
+        services = [_search_service(n) for n in ("alpha", "beta")]
+        calls = []
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        svc._services_by_name = None
+        monkeypatch.setattr(svc, "list_search_services", lambda: calls.append(1) or services)
+
+        assert svc.get_service_by_endpoint("https://beta.search.windows.net").name == "beta"
+        assert svc.get_service_by_endpoint("https://alpha.search.windows.net/").name == "alpha"
+        assert svc.get_service_by_endpoint("https://gamma.search.windows.net") is None
+        assert len(calls) == 1
+
+        svc.get_service_by_endpoint("https://alpha.search.windows.net", refresh=True)
+        assert len(calls) == 2
+
+
+class TestParseIndex:
+    """Tests for SearchInventoryService._parse_index."""
+
+    def test_fields_mapped_from_api_names(self, search_service):
+        data = {
+            "name": "idx",
+            "fields": [
+                {"name": "id", "type": "Edm.String", "key": True},
+                {
+                    "name": "vec", "type": "Collection(Edm.Single)", "searchable": True,
+                    "retrievable": False, "dimensions": 1536,
+                    "vectorSearchProfile": "profile", "searchAnalyzer": "en.lucene",
+                },
+            ],
+        }
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        index = svc._parse_index(search_service, data)
+
+        key_field, vec_field = index.fields
+        assert key_field.key is True
+        assert key_field.retrievable is True
+        assert vec_field.retrievable is False
+        assert vec_field.dimensions == 1536
+        assert vec_field.vector_search_profile == "profile"
+        assert vec_field.search_analyzer == "en.lucene"
+        assert vec_field.is_vector_field is True
+
+    def test_semantic_config_and_profiles_mapped_from_api_names(self, search_service):
+        data = {
+            "name": "idx",
+            "fields": [],
+            "semantic": {
+                "defaultConfiguration": "sem",
+                "configurations": [{
+                    "name": "sem",
+                    "prioritizedFields": {
+                        "titleField": {"fieldName": "title"},
+                        "contentFields": [{"fieldName": "content"}],
+                    },
+                }],
+            },
+            "vectorSearch": {
+                "profiles": [{"name": "profile", "algorithmConfigurationName": "hnsw-1"}],
+            },
+        }
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        index = svc._parse_index(search_service, data)
+
+        prioritized = index.semantic_configurations[0].prioritized_fields
+        assert index.default_semantic_configuration == "sem"
+        assert prioritized.title_field.field_name == "title"
+        assert [f.field_name for f in prioritized.content_fields] == ["content"]
+        assert index.vector_search.profiles[0].algorithm_configuration_name == "hnsw-1"
+
+    def test_ga_vector_search_profiles(self, search_service):
+        # vectorSearch block as returned by the GA (2024-07-01) index API
+        data = {
+            "name": "idx",
+            "fields": [],
+            "vectorSearch": {
+                "algorithms": [{
+                    "name": "hnsw-1",
+                    "kind": "hnsw",
+                    "hnswParameters": {"metric": "cosine", "m": 4, "efConstruction": 400, "efSearch": 500},
+                }],
+                "profiles": [{"name": "profile", "algorithm": "hnsw-1", "vectorizer": "openai-vec"}],
+                "vectorizers": [{"name": "openai-vec", "kind": "azureOpenAI"}],
+                "compressions": [],
+            },
+        }
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        index = svc._parse_index(search_service, data)
+
+        profile = index.vector_search.profiles[0]
+        assert profile.name == "profile"
+        assert profile.algorithm_configuration_name == "hnsw-1"
+        assert profile.vectorizer_name == "openai-vec"
+
+
+class TestInventoryAll:
+    """Tests for concurrent index inventory across services."""
+
+    def test_results_follow_service_order(self, fake_async_client):
+        def handler(request):
+            host = request.url.host.split(".")[0]
+            if request.url.path.endswith("/indexes"):
+                return httpx.Response(200, json={"value": [
+                    {"name": f"{host}-idx", "fields": []},
+                ]})
+            return httpx.Response(200, text="7")
+
+        fake_async_client(handler)
+
+        services = [_search_service(n) for n in ("one", "two", "three")]
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        svc._mgmt_client = MagicMock()
+        svc._mgmt_client.admin_keys.get.return_value = MagicMock(primary_key="k")
+        svc._admin_keys = {}
+
+        results = asyncio.run(svc.inventory_all(services, concurrency=2, include_stats=True))
+
+        assert [[i.name for i in r] for r in results] == [["one-idx"], ["two-idx"], ["three-idx"]]
+        assert all(r[0].document_count == 7 for r in results)
+
+        results = asyncio.run(svc.inventory_all(services, concurrency=2))
+        assert all(r[0].document_count is None for r in results)
+        assert svc._mgmt_client.admin_keys.get.call_count == 3
+
+
+class TestAdminKeyPrefetch:
+    """Tests for SearchInventoryService admin key caching."""
+
+    def test_prefetched_keys_reused_and_failures_skipped(self):
+        def get_keys(resource_group_name, search_service_name):
+            if search_service_name == "broken":
+                raise RuntimeError("forbidden")
+            return MagicMock(primary_key=f"{search_service_name}-key")
+
+        services = [_search_service(n) for n in ("one", "broken", "two")]
+
+        svc = SearchInventoryService.__new__(SearchInventoryService)
+        svc._mgmt_client = MagicMock()
+        svc._mgmt_client.admin_keys.get.side_effect = get_keys
+        svc._admin_keys = {}
+
+        svc.prefetch_admin_keys(services)
+        assert svc._admin_keys == {"one": "one-key", "two": "two-key"}
+
+        svc.prefetch_admin_keys(services[::2])
+        assert svc._get_admin_key(services[2]) == "two-key"
+        assert svc._mgmt_client.admin_keys.get.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# HTTP retry transport
+# ---------------------------------------------------------------------------
+
+class TestRetryTransport:
+    """Tests for the shared retrying HTTP transport."""
+
+    def test_throttled_request_retried_with_retry_after(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(http_client.time, "sleep", sleeps.append)
+        statuses = iter([429, 503, 200])
+
+        def handler(request):
+            status = next(statuses)
+            headers = {"Retry-After": "2"} if status == 429 else {}
+            return httpx.Response(status, headers=headers)
+
+        client = httpx.Client(transport=http_client.RetryTransport(httpx.MockTransport(handler)))
+        response = client.get("https://management.azure.com/")
+
+        assert response.status_code == 200
+        assert sleeps[0] == 2.0
+        assert 0 <= sleeps[1] <= http_client.BACKOFF_INITIAL_SECONDS * 2
+
+    def test_gives_up_after_max_retries(self, monkeypatch):
+        monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        transport = http_client.RetryTransport(httpx.MockTransport(handler), max_retries=2)
+        response = httpx.Client(transport=transport).get("https://management.azure.com/")
+
+        assert response.status_code == 503
+        assert len(calls) == 3
+
+    def test_post_not_retried_after_read_timeout(self, monkeypatch):
+        monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = httpx.Client(transport=http_client.RetryTransport(httpx.MockTransport(handler)))
+        with pytest.raises(httpx.ReadTimeout):
+            client.post("https://acct.services.ai.azure.com/openai/responses", json={})
+
+        assert len(calls) == 1
+
+    def test_post_retried_only_when_not_delivered(self, monkeypatch):
+        monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+        outcomes = iter(["connect", 429, 503])
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            outcome = next(outcomes)
+            if outcome == "connect":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(outcome)
+
+        client = httpx.Client(transport=http_client.RetryTransport(httpx.MockTransport(handler)))
+        response = client.post("https://management.azure.com/", json={})
+
+        # Connect error and 429 are resent; the 503 may have been applied
+        assert response.status_code == 503
+        assert len(calls) == 3
+
+
+# ---------------------------------------------------------------------------
+# AgentTestRunner
+# ---------------------------------------------------------------------------
+
+class TestAgentTestRunner:
+    """Tests for AgentTestRunner request handling."""
+
+    ENDPOINT = "https://acct.services.ai.azure.com/api/projects/proj"
+
+    @pytest.fixture
+    def agent_responses(self, monkeypatch, fake_async_client):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("/conversations"):
+                return httpx.Response(200, json={"id": "conv-1"})
+            body = orjson.loads(request.content)
+            if body["input"] == "fail":
+                return httpx.Response(500, text="agent not found")
+            return httpx.Response(200, json={
+                "output_text": f"answer to {body['input']}",
+                "tool_calls": [
+                    {"type": "file_search"}, {"type": "azure_ai_search"}, {"type": "file_search"},
+                ],
+                "citations": [{"url": "doc1"}],
+                "usage": {"total_tokens": 42},
+            })
+
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            httpx, "Client",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler)),
+        )
+        fake_async_client(handler)
+        return requests
+
+    def test_single_query_parsed(self, mock_credential, agent_responses):
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+        result = runner.test_agent("agent", "hello")
+
+        assert result.success is True
+        assert result.response_text == "answer to hello"
+        assert result.tool_calls_count == 3
+        assert result.tool_types == ["file_search", "azure_ai_search"]
+        assert result.citation_count == 1
+        assert result.total_tokens == 42
+        assert [r.url.path for r in agent_responses] == ["/api/projects/proj/openai/responses"]
+
+    def test_suite_results_follow_query_order(self, mock_credential, agent_responses):
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+        results = runner.run_test_suite("agent", ["one", "fail", "two"])
+
+        assert [r.query for r in results] == ["one", "fail", "two"]
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error_type == "http_error"
+        assert results[1].error_message == "HTTP 500: agent not found"
+        assert mock_credential.get_token_calls == 1
+
+    def test_shared_conversation_reuses_one_conversation(self, mock_credential, agent_responses):
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+        results = runner.run_test_suite("agent", ["one", "two"], shared_conversation=True)
+
+        paths = [r.url.path.rsplit("/", 1)[1] for r in agent_responses]
+        assert paths == ["conversations", "responses", "responses"]
+        assert [orjson.loads(r.content)["input"] for r in agent_responses[1:]] == ["one", "two"]
+        assert all(orjson.loads(r.content)["conversation"] == "conv-1" for r in agent_responses[1:])
+        assert all(r.success for r in results)
+
+    def test_suite_concurrency_bounded(self, mock_credential, monkeypatch):
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT, max_concurrency=2)
+        in_flight = []
+        peak = []
+
+        async def fake_test_agent(agent_name, query, timeout_seconds=60, client=None):
+            in_flight.append(query)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(query)
+            return AgentTestResult(agent_name=agent_name, query=query)
+
+        monkeypatch.setattr(runner, "test_agent_async", fake_test_agent)
+        results = runner.run_test_suite("agent", [str(i) for i in range(6)])
+
+        assert [r.query for r in results] == [str(i) for i in range(6)]
+        assert max(peak) == 2
+
+    def test_async_query_budget_enforced(self, mock_credential, monkeypatch):
+        async def slow_handler(request):
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={})
+
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(slow_handler)) as client:
+                return await runner.test_agent_async("agent", "q", timeout_seconds=0.05, client=client)
+
+        result = asyncio.run(run())
+
+        assert result.success is False
+        assert result.error_type == "timeout"
+
+    def test_rate_limiter_paces_starts(self):
+        async def run():
+            limiter = RateLimiter(qps=50, burst=2)
+            starts = []
+            for _ in range(4):
+                async with limiter:
+                    starts.append(time.monotonic())
+            return starts
+
+        starts = asyncio.run(run())
+
+        # Two start immediately; the next two wait for the 40ms window to roll over
+        assert starts[1] - starts[0] < 0.02
+        assert starts[2] - starts[0] >= 0.035
+
+    def test_throttled_query_retried_before_failing(self, mock_credential, monkeypatch):
+        monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+        statuses = iter([429, 429, 200])
+
+        def handler(request):
+            status = next(statuses)
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "1"})
+            return httpx.Response(200, json={"output_text": "ok"})
+
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT, max_retries=2)
+        # Swap the network layer under the runner's retry transport
+        runner._http._transport._transport = httpx.MockTransport(handler)
+
+        result = runner.test_agent("agent", "q")
+
+        assert result.success is True
+        assert result.response_text == "ok"
+
+    def test_sync_query_timeout_not_resent(self, mock_credential, monkeypatch):
+        monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+        runner._http._transport._transport = httpx.MockTransport(handler)
+
+        result = runner.test_agent("agent", "q", timeout_seconds=5)
+
+        assert len(calls) == 1
+        assert result.success is False
+        assert result.error_type == "timeout"
+
+    def test_sync_throttle_retry_respects_budget(self, mock_credential, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(http_client.time, "sleep", sleeps.append)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            assert request.extensions["timeout"]["read"] <= 5
+            return httpx.Response(429, headers={"Retry-After": "30"})
+
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+        runner._http._transport._transport = httpx.MockTransport(handler)
+
+        result = runner.test_agent("agent", "q", timeout_seconds=5)
+
+        # Waiting out Retry-After would overrun the 5s budget
+        assert len(calls) == 1
+        assert sleeps == []
+        assert result.error_message.startswith("HTTP 429")
+
+    def test_batch_validate_matches_single_validation(self, mock_credential):
+        runner = AgentTestRunner(mock_credential, self.ENDPOINT)
+        results = [
+            AgentTestResult(agent_name="a", query="q", success=False, error_message="boom"),
+            AgentTestResult(agent_name="a", query="q", success=True, response_text="ok"),
+            AgentTestResult(
+                agent_name="a", query="q", success=True, response_text="ok",
+                has_citations=True, citation_count=1, tool_calls_count=1,
+            ),
+        ]
+
+        assert runner.batch_validate(results) == [
+            (False, ["Request failed: boom"]),
+            (False, ["No citations in response", "No tool calls made"]),
+            (True, []),
+        ]
+        assert runner.batch_validate(results[1:2], require_citations=False) == [
+            (False, ["No tool calls made"]),
+        ]
+        assert [runner.validate_agent_response(r) for r in results] == runner.batch_validate(results)